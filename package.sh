@@ -24,7 +24,6 @@ echo "Cleaning up..."
 find dist/$PACKAGE_NAME -name "__pycache__" -type d -exec rm -rf {} + 2>/dev/null || true
 find dist/$PACKAGE_NAME -name "*.pyc" -delete 2>/dev/null || true
 find dist/$PACKAGE_NAME -name "venv*" -type d -exec rm -rf {} + 2>/dev/null || true
-rm -f dist/$PACKAGE_NAME/src/*_mcp_server_fixed.py
 rm -f dist/$PACKAGE_NAME/src/test_*.py
 
 # Update config template
@@ -26,6 +26,14 @@ class CostParameters:
     replication_factor: int = 3
     storage_utilization: float = 0.9  # 90% utilization
     overprovisioning: float = 0.2  # 20% overhead
+
+
+def _monthly_ops(baseline: int, peak: int, peak_hour_count: int) -> float:
+    """Monthly operations for a day of peak_hour_count peak hours, rest at baseline."""
+    return (
+        baseline * (24 - peak_hour_count) * 30.5 * 3600 +
+        peak * peak_hour_count * 30.5 * 3600
+    )
     
 
 class ScyllaDBCostCalculator:
@@ -95,23 +103,10 @@ class ScyllaDBCostCalculator:
         """Calculate DynamoDB costs with on-demand pricing."""
         
         # Calculate total monthly operations
-        total_read_hours = len(workload.peak_read_hours)
-        total_write_hours = len(workload.peak_write_hours)
-        
-        baseline_read_hours = 24 - total_read_hours
-        baseline_write_hours = 24 - total_write_hours
-        
-        # Monthly reads
-        monthly_reads = (
-            workload.baseline_reads * baseline_read_hours * 30.5 * 3600 +
-            workload.peak_reads * total_read_hours * 30.5 * 3600
-        )
-        
-        # Monthly writes
-        monthly_writes = (
-            workload.baseline_writes * baseline_write_hours * 30.5 * 3600 +
-            workload.peak_writes * total_write_hours * 30.5 * 3600
-        )
+        monthly_reads = _monthly_ops(workload.baseline_reads, workload.peak_reads,
+                                     len(workload.peak_read_hours))
+        monthly_writes = _monthly_ops(workload.baseline_writes, workload.peak_writes,
+                                      len(workload.peak_write_hours))
         
         # Calculate costs
         read_cost = monthly_reads * self.DYNAMODB_READ_UNIT_COST
@@ -212,17 +207,19 @@ class ScyllaDBCostCalculator:
         
         base_url = "https://calculator.scylladb.com/"
         
-        # Build series data (24 hour pattern)
+        # Build series data (24 hour pattern); bit h of a mask marks a peak hour
+        read_mask = sum(1 << h for h in set(workload.peak_read_hours))
+        write_mask = sum(1 << h for h in set(workload.peak_write_hours))
         read_series = []
         write_series = []
         
         for hour in range(24):
-            if hour in workload.peak_read_hours:
+            if (read_mask >> hour) & 1:
                 read_series.append(str(workload.peak_reads))
             else:
                 read_series.append(str(workload.baseline_reads))
                 
-            if hour in workload.peak_write_hours:
+            if (write_mask >> hour) & 1:
                 write_series.append(str(workload.peak_writes))
             else:
                 write_series.append(str(workload.baseline_writes))
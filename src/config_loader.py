@@ -0,0 +1,30 @@
+#!/usr/bin/env python3
+"""Shared loader for the MCP server env block in .claude/config.json."""
+
+import json
+import os
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Mapping
+
+# Resolved from this file, so scripts work from any working directory
+CONFIG_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '.claude', 'config.json')
+
+
+@lru_cache(maxsize=1)
+def load_env() -> Mapping[str, str]:
+    """
+    Read the scylladb env block once and export it to os.environ.
+    
+    Keys starting with "//" are comments in the example config and are skipped.
+    A missing config file leaves the environment untouched.
+    """
+    if not os.path.exists(CONFIG_PATH):
+        return MappingProxyType({})
+    
+    with open(CONFIG_PATH, 'r') as f:
+        env = json.load(f)['mcpServers']['scylladb']['env']
+    
+    env = {k: v for k, v in env.items() if not k.startswith('//')}
+    os.environ.update(env)
+    return MappingProxyType(env)
@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+"""Shared boto3 setup for the Alternator connection test scripts."""
+
+from functools import lru_cache
+
+import boto3
+from botocore.config import Config
+
+# One session per process: botocore's service models load once and are
+# reused by every client/resource. Create clients from the main thread;
+# Session itself is not thread-safe, the clients it returns are.
+SESSION = boto3.session.Session()
+
+# Keep-alive pooling with short timeouts; a dead endpoint should fail fast
+CFG = Config(
+    max_pool_connections=64,
+    tcp_keepalive=True,
+    connect_timeout=2,
+    read_timeout=5,
+    retries={'max_attempts': 2, 'mode': 'adaptive'}
+)
+
+# Alternator accepts any credentials unless auth is enabled on the cluster
+_ALTERNATOR_CREDENTIALS = {'aws_access_key_id': 'None', 'aws_secret_access_key': 'None'}
+
+
+@lru_cache(maxsize=None)
+def alternator_client(endpoint: str, region: str = 'us-east-1'):
+    """DynamoDB client for an Alternator endpoint; one warm client per endpoint."""
+    return SESSION.client(
+        'dynamodb', endpoint_url=endpoint, region_name=region,
+        config=CFG, **_ALTERNATOR_CREDENTIALS
+    )
+
+
+@lru_cache(maxsize=None)
+def alternator_resource(endpoint: str, region: str = 'us-east-1'):
+    """DynamoDB resource for an Alternator endpoint; one per endpoint."""
+    return SESSION.resource(
+        'dynamodb', endpoint_url=endpoint, region_name=region,
+        config=CFG, **_ALTERNATOR_CREDENTIALS
+    )
@@ -8,16 +8,28 @@ os.environ['CASS_DRIVER_NO_TWISTED'] = '1'
 os.environ['CASS_DRIVER_NO_LIBEV'] = '1'
 
 import asyncio
+import hashlib
+import itertools
 import json
 import logging
-from typing import Dict, Any, Optional, List
+import re
+import statistics
+from typing import Dict, Any, AsyncIterator, Optional, List, Tuple
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import lru_cache
+from operator import itemgetter
+from pathlib import Path
+from types import MappingProxyType
 import time
 
-import docker
-import boto3
-from cassandra.cluster import Cluster
+from cassandra.cluster import Cluster, Session, ExecutionProfile, EXEC_PROFILE_DEFAULT
 from cassandra.auth import PlainTextAuthProvider
+from cassandra.concurrent import execute_concurrent_with_args
+from cassandra.metadata import protect_name
+from cassandra.policies import TokenAwarePolicy, DCAwareRoundRobinPolicy
+from cassandra.query import SimpleStatement, PreparedStatement
 from mcp.server import Server
 from mcp.server.models import InitializationOptions
 from mcp.server.stdio import stdio_server
@@ -36,18 +48,206 @@ except ImportError:
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("scylladb-mcp")
 
-@dataclass
+# execute only ever shows the first page; never pull pages we won't display
+EXECUTE_FETCH_SIZE = 100
+
+# populateData: target keyspace, and bound INSERTs kept in flight
+DEMO_KEYSPACE = 'scylladb_demo'
+POPULATE_CONCURRENCY = 100
+
+# How long a fresh ScyllaDB container gets to open its CQL port
+CQL_READY_TIMEOUT = 60.0
+# Per-request timeout for CQL statements (driver default is 10s)
+CQL_REQUEST_TIMEOUT = 15.0
+
+# comparePerformance: BatchWriteItem max size, and requests kept in flight
+PERF_BATCH_SIZE = 25
+PERF_MAX_WORKERS = 32
+PERF_PAYLOAD = 'x' * 1024  # 1KB item body, built once
+# Low-level clients skip the resource layer; pool sized for PERF_MAX_WORKERS
+BOTO_CONFIG_KWARGS = MappingProxyType({
+    'max_pool_connections': 2 * PERF_MAX_WORKERS,
+    'retries': {'mode': 'standard', 'total_max_attempts': 2}
+})
+PERF_METRICS_TEMPLATE = (
+    "  Avg latency: {avg_latency:.1f}ms\n"
+    "  P99 latency: {p99_ms:.1f}ms\n"
+    "  Throughput: {throughput:.0f} ops/sec\n"
+)
+
+# boto3 and docker each cost ~100ms+ to import; only pay for the mode in use
+@lru_cache(maxsize=None)
+def _get_boto3():
+    """Import boto3 on first use."""
+    import boto3
+    return boto3
+
+
+@lru_cache(maxsize=None)
+def _boto_config():
+    """Shared botocore Config for every client, built on first use."""
+    from botocore.config import Config
+    return Config(**BOTO_CONFIG_KWARGS)
+
+
+@lru_cache(maxsize=None)
+def _get_docker():
+    """Import docker on first use."""
+    import docker
+    return docker
+
+# DynamoDB API calls checkMigration looks for; API names are case-sensitive
+_CODE_TOKENS = re.compile(
+    r"get_item|put_item|getItem|putItem|query|scan|transact_|TransactWriteItems"
+    r"|IndexName|(?i:global_secondary_index|gsi)|(?i:stream)"
+)
+# Keywords execute looks for, matched in one case-insensitive pass
+_QUERY_TOKENS = re.compile(r"allow filtering|select \* from|where", re.IGNORECASE)
+
+
+def _token_hits(pattern: re.Pattern, text: str) -> set:
+    """Lowercased set of every token pattern matches in text."""
+    return {m.group(0).lower() for m in pattern.finditer(text)}
+
+
+@dataclass(frozen=True)
+class CodeScan:
+    """DynamoDB API usage found in a code snippet."""
+    has_get_put: bool
+    has_js_get_put: bool
+    has_query: bool
+    has_index_name: bool
+    has_gsi: bool
+    has_scan: bool
+    has_transact: bool
+    has_stream: bool
+
+
+@lru_cache(maxsize=128)
+def scan_code(code: str) -> CodeScan:
+    """Scan code once for DynamoDB tokens. Cached: users iterate on the same snippet."""
+    hits = {m.group(0) for m in _CODE_TOKENS.finditer(code)}
+    lowered = {h.lower() for h in hits}
+    return CodeScan(
+        has_get_put=bool(hits & {"get_item", "put_item"}),
+        has_js_get_put=bool(hits & {"getItem", "putItem"}),
+        has_query="query" in hits,
+        has_index_name="IndexName" in hits,
+        has_gsi=bool(lowered & {"global_secondary_index", "gsi"}),
+        has_scan="scan" in hits,
+        has_transact=bool(hits & {"transact_", "TransactWriteItems"}),
+        has_stream="stream" in lowered,
+    )
+
+
+def _shard_key(key: str) -> str:
+    """
+    Prefix a key with a hex byte derived from its hash ('3f#ddb-17').
+    
+    Spreads sequential benchmark keys across 256 prefixes so they can't pile
+    onto adjacent partitions, while staying deterministic so a later 'read'
+    run finds the keys an earlier 'write' run created.
+    """
+    return f"{hashlib.blake2b(key.encode(), digest_size=1).hexdigest()}#{key}"
+
+
+# costEstimate pricing (us-east-1 on-demand; i3.2xlarge handles ~50K ops/sec)
+SECONDS_PER_MONTH = 30 * 24 * 3600
+DDB_READ_PRICE_PER_M = 0.25
+DDB_WRITE_PRICE_PER_M = 1.25
+DDB_STORAGE_PRICE_PER_GB = 0.25
+SCYLLA_OPS_PER_INSTANCE = 50_000
+SCYLLA_INSTANCE_MONTHLY = 624  # i3.2xlarge
+COST_SUMMARY_TEMPLATE = "\n".join([
+    "Cost Analysis",
+    "=" * 50,
+    "",
+    "DynamoDB Monthly Cost:",
+    "  Reads: ${read_cost:,.2f}",
+    "  Writes: ${write_cost:,.2f}",
+    "  Storage: ${storage_cost:,.2f}",
+    "  Total: ${dynamodb_total:,.2f}",
+    "",
+    "ScyllaDB Estimated Cost:",
+    "  Instances: {instances_needed} × i3.2xlarge",
+    "  Total: ${scylla_cost:,.2f}",
+    "  Savings: ${savings:,.2f} ({savings_percent:.0f}%)",
+    "",
+])
+
+
+@lru_cache(maxsize=256)
+def _cost_summary(reads_per_sec: int, writes_per_sec: int, storage_gb: int) -> str:
+    """DynamoDB vs ScyllaDB monthly cost block. Pure, so repeat estimates are free."""
+    read_cost = reads_per_sec * SECONDS_PER_MONTH / 1_000_000 * DDB_READ_PRICE_PER_M
+    write_cost = writes_per_sec * SECONDS_PER_MONTH / 1_000_000 * DDB_WRITE_PRICE_PER_M
+    storage_cost = storage_gb * DDB_STORAGE_PRICE_PER_GB
+    dynamodb_total = read_cost + write_cost + storage_cost
+    
+    # ScyllaDB estimate (rough - depends on instance selection)
+    instances_needed = max(1, (reads_per_sec + writes_per_sec) // SCYLLA_OPS_PER_INSTANCE)
+    scylla_cost = instances_needed * SCYLLA_INSTANCE_MONTHLY
+    savings = dynamodb_total - scylla_cost
+    
+    return COST_SUMMARY_TEMPLATE.format(
+        read_cost=read_cost,
+        write_cost=write_cost,
+        storage_cost=storage_cost,
+        dynamodb_total=dynamodb_total,
+        instances_needed=instances_needed,
+        scylla_cost=scylla_cost,
+        savings=savings,
+        savings_percent=savings / dynamodb_total * 100 if dynamodb_total else 0
+    )
+
+
+@lru_cache(maxsize=256)
+def _advanced_cost(reads_per_sec: int, writes_per_sec: int, storage_gb: int,
+                   item_size_kb: float, pattern: str) -> str:
+    """calculate_advanced_cost, memoized: the report depends only on its inputs."""
+    return calculate_advanced_cost(
+        reads_per_sec=reads_per_sec,
+        writes_per_sec=writes_per_sec,
+        storage_gb=storage_gb,
+        item_size_kb=item_size_kb,
+        pattern=pattern
+    )
+
+
+def _log_startup_connect(task: asyncio.Task) -> None:
+    """Log how the background startup connection went; failures are not fatal."""
+    if task.cancelled():
+        return
+    if task.exception() is not None:
+        logger.error(f"Startup connection failed: {task.exception()}")
+    else:
+        logger.info(task.result())
+
+
+# Shared, read-only context for every error response
+_ERROR_CTX = MappingProxyType({'pattern': 'error'})
+
+
+@dataclass(slots=True)
 class DatabaseConnections:
-    """Database connection container."""
+    """Database connection container. Slotted: touched on every tool call."""
     dynamodb: Optional[Any] = None
-    scylla: Optional[Any] = None
+    scylla: Optional[Session] = None
     alternator: Optional[Any] = None
+    dynamodb_client: Optional[Any] = None
+    alternator_client: Optional[Any] = None
     docker_container: Optional[Any] = None
 
 
 class ScyllaDBMCPServer:
     """Main MCP server for ScyllaDB with technical advisor personality."""
     
+    __slots__ = (
+        'server', 'connections', 'docker_client', 'advisor',
+        'technical_advisor', 'query_analyzer', '_connect_lock',
+        '_ensured_keyspaces', '_prepared', '_dispatch', '_tools',
+    )
+    
     def __init__(self):
         self.server = Server(
             name="scylladb-mcp",
@@ -58,152 +258,204 @@ class ScyllaDBMCPServer:
         self.advisor = ScyllaDBAdvisor()
         self.technical_advisor = TechnicalAdvisor()
         self.query_analyzer = DynamoDBQueryAnalyzer()
+        self._connect_lock = asyncio.Lock()
+        self._ensured_keyspaces: set = set()
+        # (keyspace, query) -> PreparedStatement for the current session
+        self._prepared: Dict[Tuple[str, str], PreparedStatement] = {}
         self._register_handlers()
     
+    @staticmethod
+    def _err(message: str) -> str:
+        """Format an error response."""
+        return technical_response(message, _ERROR_CTX)
+    
     async def create_connections(self):
         """Create database connections based on environment."""
         mode = os.getenv('SCYLLA_CONNECTION_MODE', 'docker')
         
-        if mode == 'docker':
-            await self._handle_connect('docker')
-        elif mode == 'alternator':
-            await self._handle_connect('alternator')
-        else:
-            await self._handle_connect('cloud')
+        if mode in ('docker', 'alternator'):
+            return await self._handle_connect(mode)
+        return f"No startup connection for mode '{mode}'. Run 'connect' when ready."
     
     def _register_handlers(self):
         """Register all MCP handlers with technical descriptions."""
         
-        # Register list_tools handler
-        @self.server.list_tools()
-        async def list_tools():
-            """List all available tools."""
-            return [
-                Tool(
-                    name="connect",
-                    description="Connect to ScyllaDB instance. Modes: 'docker' (local), 'cloud' (managed), 'alternator' (DynamoDB API)",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "mode": {
-                                "type": "string",
-                                "enum": ["docker", "cloud", "alternator"],
-                                "default": "docker"
-                            }
+        # The tool list is static: build it once, not on every list_tools call
+        self._tools = [
+            Tool(
+                name="connect",
+                description="Connect to ScyllaDB instance. Modes: 'docker' (local), 'cloud' (managed), 'alternator' (DynamoDB API)",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "mode": {
+                            "type": "string",
+                            "enum": ["docker", "cloud", "alternator"],
+                            "default": "docker"
                         }
                     }
-                ),
-                Tool(
-                    name="execute",
-                    description="Execute CQL queries. Returns technical analysis of query patterns and performance implications.",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "query": {"type": "string"},
-                            "keyspace": {"type": "string", "default": "demo"}
-                        },
-                        "required": ["query"]
-                    }
-                ),
-                Tool(
-                    name="checkMigration",
-                    description="Analyze DynamoDB code for ScyllaDB compatibility. Returns effort estimate and specific issues.",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "code": {"type": "string"},
-                            "language": {
-                                "type": "string",
-                                "enum": ["python", "javascript", "java", "go"],
-                                "default": "python"
-                            }
-                        },
-                        "required": ["code"]
-                    }
-                ),
-                Tool(
-                    name="analyzeWorkload",
-                    description="Deep analysis of DynamoDB access patterns. Detects hot partitions, inefficient queries, cost drivers.",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "code_path": {"type": "string"},
-                            "deep_analysis": {"type": "boolean", "default": True}
+                }
+            ),
+            Tool(
+                name="execute",
+                description="Execute CQL queries. Returns technical analysis of query patterns and performance implications.",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "query": {"type": "string"},
+                        "keyspace": {"type": "string", "default": "demo"},
+                        "params": {
+                            "type": "array",
+                            "description": "Values for ? bind markers; the query is prepared once and reused"
+                        }
+                    },
+                    "required": ["query"]
+                }
+            ),
+            Tool(
+                name="checkMigration",
+                description="Analyze DynamoDB code for ScyllaDB compatibility. Returns effort estimate and specific issues.",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "code": {"type": "string"},
+                        "language": {
+                            "type": "string",
+                            "enum": ["python", "javascript", "java", "go"],
+                            "default": "python"
+                        }
+                    },
+                    "required": ["code"]
+                }
+            ),
+            Tool(
+                name="analyzeWorkload",
+                description="Deep analysis of DynamoDB access patterns. Detects hot partitions, inefficient queries, cost drivers.",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "code_path": {"type": "string"},
+                        "deep_analysis": {"type": "boolean", "default": True}
+                    },
+                    "required": ["code_path"]
+                }
+            ),
+            Tool(
+                name="comparePerformance",
+                description="Live A/B test: DynamoDB vs ScyllaDB. Shows real latency, throughput, and cost differences.",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "operation": {
+                            "type": "string",
+                            "enum": ["write", "batch", "read"],
+                            "default": "write"
                         },
-                        "required": ["code_path"]
+                        "itemCount": {"type": "integer", "default": 1000}
                     }
-                ),
-                Tool(
-                    name="comparePerformance",
-                    description="Live A/B test: DynamoDB vs ScyllaDB. Shows real latency, throughput, and cost differences.",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "operation": {
-                                "type": "string",
-                                "enum": ["write", "read", "scan", "batch"],
-                                "default": "write"
-                            },
-                            "itemCount": {"type": "integer", "default": 1000}
+                }
+            ),
+            Tool(
+                name="costEstimate",
+                description="Calculate cost comparison based on workload. No fluff, just numbers.",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "reads_per_sec": {"type": "integer"},
+                        "writes_per_sec": {"type": "integer"},
+                        "storage_gb": {"type": "integer"},
+                        "item_size_kb": {"type": "number", "default": 1},
+                        "pattern": {
+                            "type": "string",
+                            "enum": ["steady", "bursty", "time_series"],
+                            "default": "steady"
                         }
-                    }
-                ),
-                Tool(
-                    name="costEstimate",
-                    description="Calculate cost comparison based on workload. No fluff, just numbers.",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "reads_per_sec": {"type": "integer"},
-                            "writes_per_sec": {"type": "integer"},
-                            "storage_gb": {"type": "integer"},
-                            "item_size_kb": {"type": "number", "default": 1},
-                            "pattern": {
-                                "type": "string",
-                                "enum": ["steady", "bursty", "time_series"],
-                                "default": "steady"
-                            }
+                    },
+                    "required": ["reads_per_sec", "writes_per_sec", "storage_gb"]
+                }
+            ),
+            Tool(
+                name="populateData",
+                description="Populate test data with realistic patterns. Sources: dynamodb_style (hot partitions), ycsb (benchmark).",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "source": {
+                            "type": "string",
+                            "enum": ["dynamodb_style", "ycsb"]
                         },
-                        "required": ["reads_per_sec", "writes_per_sec", "storage_gb"]
-                    }
-                )
-            ]
+                        "table": {"type": "string", "default": "test_table"},
+                        "rows": {"type": "integer", "default": 1000}
+                    },
+                    "required": ["source"]
+                }
+            ),
+            Tool(
+                name="analyzeDynamoDBModel",
+                description="Analyze an AWS DynamoDB data model for ScyllaDB migration. Returns complexity, cost implications and anti-patterns.",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "data_model": {"type": "string"},
+                        "requirements": {"type": "string"}
+                    },
+                    "required": ["data_model"]
+                }
+            )
+        ]
+        
+        # Register list_tools handler
+        @self.server.list_tools()
+        async def list_tools():
+            """List all available tools."""
+            return self._tools
+        
+        # Tool name -> handler taking the raw arguments dict; built once
+        self._dispatch = {
+            "connect": lambda a: self._handle_connect(a.get("mode", "docker")),
+            "execute": lambda a: self._handle_execute(
+                a["query"],
+                a.get("keyspace", "demo"),
+                a.get("params")
+            ),
+            "checkMigration": lambda a: self._handle_check_migration(
+                a["code"],
+                a.get("language", "python")
+            ),
+            "analyzeWorkload": lambda a: self._stream_tool(self._stream_analyze_workload(
+                a["code_path"],
+                a.get("deep_analysis", True)
+            )),
+            "comparePerformance": lambda a: self._stream_tool(self._stream_compare_performance(
+                a.get("operation", "write"),
+                a.get("itemCount", 1000)
+            )),
+            "costEstimate": lambda a: self._handle_cost_estimate(
+                a["reads_per_sec"],
+                a["writes_per_sec"],
+                a["storage_gb"],
+                a.get("item_size_kb", 1),
+                a.get("pattern", "steady")
+            ),
+            "populateData": lambda a: self._handle_populate_data(
+                a["source"],
+                a.get("table", "test_table"),
+                a.get("rows", 1000)
+            ),
+            "analyzeDynamoDBModel": lambda a: self._handle_analyze_dynamodb_model(
+                a["data_model"],
+                a.get("requirements")
+            ),
+        }
         
         # Register call_tool handler
         @self.server.call_tool()
         async def call_tool(name: str, arguments: dict) -> List[TextContent]:
             """Handle tool calls."""
             try:
-                if name == "connect":
-                    result = await self._handle_connect(arguments.get("mode", "docker"))
-                elif name == "execute":
-                    result = await self._handle_execute(
-                        arguments["query"],
-                        arguments.get("keyspace", "demo")
-                    )
-                elif name == "checkMigration":
-                    result = await self._handle_check_migration(
-                        arguments["code"],
-                        arguments.get("language", "python")
-                    )
-                elif name == "analyzeWorkload":
-                    result = await self._handle_analyze_workload(
-                        arguments["code_path"],
-                        arguments.get("deep_analysis", True)
-                    )
-                elif name == "comparePerformance":
-                    result = await self._handle_compare_performance(
-                        arguments.get("operation", "write"),
-                        arguments.get("itemCount", 1000)
-                    )
-                elif name == "costEstimate":
-                    result = await self._handle_cost_estimate(
-                        arguments["reads_per_sec"],
-                        arguments["writes_per_sec"],
-                        arguments["storage_gb"],
-                        arguments.get("item_size_kb", 1),
-                        arguments.get("pattern", "steady")
-                    )
+                handler = self._dispatch.get(name)
+                if handler:
+                    result = await handler(arguments)
                 else:
                     result = f"Unknown tool: {name}"
                 
@@ -214,14 +466,40 @@ class ScyllaDBMCPServer:
                 logger.error(error_msg, exc_info=True)
                 return [TextContent(type="text", text=error_msg)]
     
+    async def _stream_tool(self, sections: AsyncIterator[str]) -> str:
+        """
+        Drain a section generator into the final response text.
+        
+        When the client sent a progressToken, each section is also pushed as a
+        progress notification so long-running tools show output as they go.
+        """
+        ctx = self.server.request_context
+        token = ctx.meta.progressToken if ctx.meta else None
+        parts = []
+        async for section in sections:
+            parts.append(section)
+            if token is not None:
+                try:
+                    await ctx.session.send_progress_notification(token, len(parts), message=section)
+                except TypeError:
+                    # Older mcp without progress messages: still report progress
+                    await ctx.session.send_progress_notification(token, len(parts))
+        return "".join(parts)
+    
     async def _handle_connect(self, mode: str) -> str:
         """Handle database connection with auto-setup."""
+        # Overlapping connect calls would race to create the same container
+        async with self._connect_lock:
+            return await self._connect(mode)
+    
+    async def _connect(self, mode: str) -> str:
+        """Connect body; callers must hold _connect_lock."""
         try:
             if mode == "docker":
                 # Check Docker availability
                 try:
-                    self.docker_client = docker.from_env()
-                    self.docker_client.ping()
+                    self.docker_client = await asyncio.to_thread(lambda: _get_docker().from_env())
+                    await asyncio.to_thread(self.docker_client.ping)
                 except Exception as e:
                     return technical_response(
                         "Docker not running. Start Docker Desktop first.",
@@ -229,7 +507,8 @@ class ScyllaDBMCPServer:
                     )
                 
                 # Look for existing container
-                containers = self.docker_client.containers.list(
+                containers = await asyncio.to_thread(
+                    self.docker_client.containers.list,
                     all=True,
                     filters={"name": "scylladb-mcp"}
                 )
@@ -237,8 +516,12 @@ class ScyllaDBMCPServer:
                 if containers:
                     container = containers[0]
                     if container.status != "running":
-                        container.start()
-                        await asyncio.sleep(5)
+                        await asyncio.to_thread(container.start)
+                        if not await self._wait_for_cql():
+                            return technical_response(
+                                f"ScyllaDB container did not accept CQL connections within {CQL_READY_TIMEOUT:.0f}s.",
+                                {'pattern': 'setup_issue'}
+                            )
                 else:
                     # Create new container
                     result = await self._create_docker_container()
@@ -246,7 +529,9 @@ class ScyllaDBMCPServer:
                         return result
                 
                 # Connect to local ScyllaDB
-                self.connections.scylla = Cluster(['localhost']).connect()
+                self.connections.scylla = await asyncio.to_thread(self._cql_connect)
+                self._prepared.clear()
+                self._ensured_keyspaces.clear()
                 
                 return technical_response(
                     "Connected to local ScyllaDB (Docker). Zero-copy networking, no cloud latency.",
@@ -262,23 +547,28 @@ class ScyllaDBMCPServer:
                         {'pattern': 'config_error'}
                     )
                 
-                self.connections.alternator = boto3.resource(
-                    'dynamodb',
+                alternator_args = dict(
                     endpoint_url=endpoint,
                     region_name='us-east-1',
                     aws_access_key_id='fake',
-                    aws_secret_access_key='fake'
+                    aws_secret_access_key='fake',
+                    config=_boto_config()
                 )
+                boto3 = _get_boto3()
+                self.connections.alternator = boto3.resource('dynamodb', **alternator_args)
+                self.connections.alternator_client = boto3.client('dynamodb', **alternator_args)
                 
                 # Also connect native DynamoDB for comparison
                 aws_key = os.getenv('AWS_ACCESS_KEY_ID')
                 if aws_key:
-                    self.connections.dynamodb = boto3.resource(
-                        'dynamodb',
+                    dynamodb_args = dict(
                         region_name='us-east-1',
                         aws_access_key_id=aws_key,
-                        aws_secret_access_key=os.getenv('AWS_SECRET_ACCESS_KEY')
+                        aws_secret_access_key=os.getenv('AWS_SECRET_ACCESS_KEY'),
+                        config=_boto_config()
                     )
+                    self.connections.dynamodb = boto3.resource('dynamodb', **dynamodb_args)
+                    self.connections.dynamodb_client = boto3.client('dynamodb', **dynamodb_args)
                 
                 return technical_response(
                     "Connected to ScyllaDB Alternator. Same DynamoDB API, better internals.",
@@ -293,12 +583,24 @@ class ScyllaDBMCPServer:
                 
         except Exception as e:
             logger.error(f"Connection failed: {e}")
-            return technical_response(
-                f"Connection failed: {str(e)}",
-                {'pattern': 'error'}
-            )
+            return self._err(f"Connection failed: {str(e)}")
     
-    async def _handle_execute(self, query: str, keyspace: str) -> str:
+    @staticmethod
+    def _cql_connect(host: str = 'localhost') -> Session:
+        """Open a CQL session with token-aware routing and an explicit timeout."""
+        profile = ExecutionProfile(
+            load_balancing_policy=TokenAwarePolicy(DCAwareRoundRobinPolicy()),
+            request_timeout=CQL_REQUEST_TIMEOUT
+        )
+        cluster = Cluster(
+            [host],
+            protocol_version=4,
+            execution_profiles={EXEC_PROFILE_DEFAULT: profile}
+        )
+        return cluster.connect()
+    
+    async def _handle_execute(self, query: str, keyspace: str,
+                              params: Optional[List[Any]] = None) -> str:
         """Execute CQL query with performance analysis."""
         if not self.connections.scylla:
             return technical_response(
@@ -307,271 +609,359 @@ class ScyllaDBMCPServer:
             )
         
         try:
-            # Create keyspace if needed
+            session = self.connections.scylla
+            
             if keyspace != "system":
-                self.connections.scylla.execute(f"""
-                    CREATE KEYSPACE IF NOT EXISTS {keyspace}
-                    WITH replication = {{
-                        'class': 'SimpleStrategy',
-                        'replication_factor': 1
-                    }}
-                """)
-                self.connections.scylla.execute(f"USE {keyspace}")
+                await self._use_keyspace(session, keyspace)
+            
+            # Bound queries are prepared once per keyspace and reused
+            if params is not None:
+                prepared = self._prepared.get((keyspace, query))
+                if prepared is None:
+                    prepared = await asyncio.to_thread(session.prepare, query)
+                    self._prepared[(keyspace, query)] = prepared
+                statement = prepared.bind(params)
+                statement.fetch_size = EXECUTE_FETCH_SIZE
+            else:
+                statement = SimpleStatement(query, fetch_size=EXECUTE_FETCH_SIZE)
             
             # Execute query
             start_time = time.time()
-            result = self.connections.scylla.execute(query)
+            result = await self._execute_async(session, statement)
             execution_time = (time.time() - start_time) * 1000
             
             # Format response with analysis
-            response = f"Query executed in {execution_time:.1f}ms\n\n"
+            parts = [f"Query executed in {execution_time:.1f}ms\n\n"]
             
             if result:
-                rows = list(result)
-                response += f"Returned {len(rows)} rows\n"
+                rows = result.current_rows
+                more = "+ (more pages)" if result.has_more_pages else ""
+                parts.append(f"Returned {len(rows)}{more} rows\n")
                 if len(rows) > 0:
-                    response += f"Sample: {rows[0]}\n"
+                    parts.append(f"Sample: {rows[0]}\n")
             
             # Add query pattern analysis
-            query_lower = query.lower()
-            if "allow filtering" in query_lower:
-                response += self.technical_advisor.react_to_design(
+            hits = _token_hits(_QUERY_TOKENS, query)
+            if "allow filtering" in hits:
+                parts.append(self.technical_advisor.react_to_design(
                     'allow_filtering'
-                )
-            elif "select * from" in query_lower and "where" not in query_lower:
-                response += self.technical_advisor.analyze_workload(
+                ))
+            elif "select * from" in hits and "where" not in hits:
+                parts.append(self.technical_advisor.analyze_workload(
                     'full_scan',
                     {'table_size_gb': 10}  # Estimate
-                )
+                ))
             
-            return response
+            return "".join(parts)
             
         except Exception as e:
-            return technical_response(
-                f"Query failed: {str(e)}",
-                {'pattern': 'error'}
-            )
+            return self._err(f"Query failed: {str(e)}")
+    
+    async def _use_keyspace(self, session: Session, keyspace: str) -> None:
+        """
+        Create keyspace once per session, switch only when it changes.
+        
+        Both statements quote the name the same way (set_keyspace uses
+        protect_name), so mixed-case names refer to one keyspace.
+        """
+        if keyspace not in self._ensured_keyspaces:
+            await self._execute_async(session, f"""
+                CREATE KEYSPACE IF NOT EXISTS {protect_name(keyspace)}
+                WITH replication = {{
+                    'class': 'SimpleStrategy',
+                    'replication_factor': 1
+                }}
+            """)
+            self._ensured_keyspaces.add(keyspace)
+        if session.keyspace != keyspace:
+            await asyncio.to_thread(session.set_keyspace, keyspace)
+    
+    @staticmethod
+    async def _execute_async(session: Session, statement):
+        """Run a statement via execute_async without blocking the event loop."""
+        loop = asyncio.get_running_loop()
+        done = loop.create_future()
+        
+        def _wake(_):
+            loop.call_soon_threadsafe(lambda: done.done() or done.set_result(None))
+        
+        response_future = session.execute_async(statement)
+        response_future.add_callbacks(_wake, _wake)
+        await done
+        return response_future.result()  # re-raises the query error, if any
     
     async def _handle_check_migration(self, code: str, language: str) -> str:
         """Check DynamoDB code compatibility."""
-        compatibility_score = 0.9  # Base compatibility
+        compatibility_score = 0.0
         issues = []
+        scan = scan_code(code)
         
-        # Analyze code patterns
-        code_lower = code.lower()
-        
-        # Check for incompatible features
-        if "transact_write" in code_lower or "transactwriteitems" in code_lower:
-            compatibility_score -= 0.1
-            issues.append("transaction: Multi-partition transactions not supported")
-        
-        if "stream" in code_lower and ("getrecords" in code_lower or "describe_stream" in code_lower):
-            compatibility_score -= 0.05
-            issues.append("stream: Use CDC instead of Streams API")
+        # Language-specific patterns
+        if language == "python":
+            # Check for basic operations
+            if scan.has_get_put:
+                compatibility_score += 0.3
+            if scan.has_query:
+                compatibility_score += 0.3
+            if scan.has_scan:
+                compatibility_score += 0.2
+                issues.append("scan operations - works but avoid in production")
+            
+            # Check for complex features
+            if scan.has_transact:
+                compatibility_score += 0.1
+                issues.append("transactions - limited to single partition")
+            if scan.has_stream:
+                compatibility_score += 0.1
+                issues.append("streams - use CDC instead")
+            
+            # If no complex features, boost score
+            if len(issues) == 0:
+                compatibility_score = 0.95
         
-        if "global_secondary_index" in code_lower or "gsi" in code_lower:
-            # GSIs are supported but note the pattern
-            issues.append("gsi: Supported, but consider materialized views")
+        elif language == "javascript":
+            if scan.has_js_get_put:
+                compatibility_score += 0.3
+            if scan.has_query:
+                compatibility_score += 0.3
+            if scan.has_transact:
+                issues.append("transactions - limited to single partition")
+            if scan.has_stream:
+                issues.append("streams - use CDC instead")
         
         # Build response
-        response = self.technical_advisor.migration_assessment({
+        parts = [self.technical_advisor.migration_assessment({
             'compatibility_score': compatibility_score,
             'issues': issues
-        })
+        })]
         
         # Add code-specific advice
+        if (scan.has_query and scan.has_index_name) or scan.has_gsi:
+            parts.append("\n\nGSI detected in code. Each GSI multiplies write costs in DynamoDB.")
+            parts.append("\nConsider materialized views in ScyllaDB for better cost efficiency.")
+        
         if language == "python":
-            response += "\n\nMigration steps:\n"
-            response += "1. Change endpoint_url to ScyllaDB Alternator\n"
-            response += "2. Set aws_access_key_id='fake' for Alternator\n"
-            response += "3. Rest of boto3 code unchanged\n"
+            parts.append("\n\nMigration steps:\n")
+            parts.append("1. Change endpoint_url to ScyllaDB Alternator\n")
+            parts.append("2. Set aws_access_key_id='fake' for Alternator\n")
+            parts.append("3. Rest of boto3 code unchanged\n")
         
-        return response
+        return "".join(parts)
     
     async def _handle_analyze_workload(self, code_path: str, deep_analysis: bool) -> str:
         """Analyze workload patterns from code."""
+        return "".join([part async for part in self._stream_analyze_workload(code_path, deep_analysis)])
+    
+    async def _stream_analyze_workload(self, code_path: str, deep_analysis: bool) -> AsyncIterator[str]:
+        """Yield the workload analysis one section at a time."""
         try:
-            # Read code file
-            with open(code_path, 'r') as f:
-                code = f.read()
+            # Read code file off the event loop
+            code = await asyncio.to_thread(
+                Path(code_path).read_text, encoding='utf-8', errors='replace'
+            )
             
             # Analyze with our query analyzer
             analysis_results = self.query_analyzer.analyze_code(code)
             
-            response = f"Workload Analysis: {code_path}\n"
-            response += "=" * 50 + "\n\n"
+            # One pass over the patterns: per-type totals plus deep-analysis triggers
+            patterns = analysis_results['patterns']
+            type_counts = Counter()
+            scan_count = 0
+            tiny_batch_sizes = []
+            for pattern in patterns:
+                type_counts[pattern['type']] += pattern['count']
+                if pattern['type'] == 'scan':
+                    scan_count += 1
+                elif pattern['type'] == 'batch_write' and pattern.get('size', 0) < 10:
+                    tiny_batch_sizes.append(pattern.get('size', 5))
             
             # Access patterns
-            response += f"Access Patterns Detected: {len(analysis_results['patterns'])}\n"
-            for pattern in analysis_results['patterns']:
-                response += f"- {pattern['type']}: {pattern['count']} occurrences\n"
+            yield "".join([
+                f"Workload Analysis: {code_path}\n", "=" * 50 + "\n\n",
+                f"Access Patterns Detected: {len(patterns)}\n",
+                *(f"- {pattern_type}: {count} occurrences\n"
+                  for pattern_type, count in type_counts.most_common())
+            ])
             
-            # Hot partitions
-            if analysis_results['hot_partitions']:
-                response += "\n⚠️  Hot Partition Alert:\n"
-                for hp in analysis_results['hot_partitions']:
-                    response += f"- Partition '{hp['partition']}': {hp['heat_ratio']:.0%} of traffic\n"
+            # Hot partitions, worst first
+            hot_partitions = sorted(
+                analysis_results['hot_partitions'],
+                key=itemgetter('heat_ratio'),
+                reverse=True
+            )
+            if hot_partitions:
+                parts = ["\n⚠️  Hot Partition Alert:\n"]
+                parts.extend(
+                    f"- Partition '{hp['partition']}': {hp['heat_ratio']:.0%} of traffic\n"
+                    for hp in hot_partitions
+                )
                 
                 # Add technical analysis
-                hp = analysis_results['hot_partitions'][0]  # Worst offender
-                response += self.technical_advisor.analyze_workload(
+                worst = hot_partitions[0]
+                parts.append(self.technical_advisor.analyze_workload(
                     'hot_partition',
                     {
-                        'heat_ratio': hp['heat_ratio'],
-                        'ops_per_sec': hp['access_count'] * 10  # Estimate
+                        'heat_ratio': worst['heat_ratio'],
+                        'ops_per_sec': worst['access_count'] * 10  # Estimate
                     }
-                )
+                ))
+                yield "".join(parts)
             
             # Performance implications
             if deep_analysis:
-                response += "\n\nPerformance Implications:\n"
-                for pattern in analysis_results['patterns']:
-                    if pattern['type'] == 'scan':
-                        response += self.technical_advisor.analyze_workload('full_scan', {'table_size_gb': 50})
-                    elif pattern['type'] == 'batch_write' and pattern.get('size', 0) < 10:
-                        response += self.technical_advisor.analyze_workload('tiny_batches', {'avg_batch_size': pattern.get('size', 5)})
+                parts = ["\n\nPerformance Implications:\n"]
+                if scan_count:
+                    full_scan = self.technical_advisor.analyze_workload('full_scan', {'table_size_gb': 50})
+                    parts.extend([full_scan] * scan_count)
+                parts.extend(
+                    self.technical_advisor.analyze_workload('tiny_batches', {'avg_batch_size': size})
+                    for size in tiny_batch_sizes
+                )
+                yield "".join(parts)
             
             # Cost implications
-            response += f"\n\nCost Drivers:\n"
-            response += f"- GSI count: {analysis_results['gsi_count']} (each GSI = duplicate write costs)\n"
-            response += f"- Scan operations: {analysis_results['scan_frequency']}/hour (expensive at scale)\n"
+            yield "".join([
+                "\n\nCost Drivers:\n",
+                f"- GSI count: {analysis_results['gsi_count']} (each GSI = duplicate write costs)\n",
+                f"- Scan operations: {analysis_results['scan_frequency']}/hour (expensive at scale)\n"
+            ])
             
             # Add technical insight
-            response += "\n" + self.technical_advisor.technical_insight('tablets')
-            
-            return response
+            yield "\n" + self.technical_advisor.technical_insight('tablets')
             
         except Exception as e:
-            return technical_response(f"Analysis failed: {str(e)}", {'pattern': 'error'})
+            yield self._err(f"Analysis failed: {str(e)}")
     
     async def _handle_compare_performance(self, operation: str, item_count: int) -> str:
         """Run live performance comparison."""
-        if not (self.connections.dynamodb and self.connections.alternator):
-            return technical_response(
+        return "".join([part async for part in self._stream_compare_performance(operation, item_count)])
+    
+    async def _stream_compare_performance(self, operation: str, item_count: int) -> AsyncIterator[str]:
+        """Yield the comparison as each benchmark finishes."""
+        if not (self.connections.dynamodb_client and self.connections.alternator_client):
+            yield technical_response(
                 "Need both DynamoDB and Alternator connections. Run 'connect' with mode='alternator'.",
                 {'pattern': 'setup_issue'}
             )
+            return
         
-        response = f"Performance Comparison: {operation} ({item_count} items)\n"
-        response += "=" * 50 + "\n\n"
+        if item_count < 1:
+            yield technical_response(
+                "itemCount must be at least 1.",
+                {'pattern': 'usage_error'}
+            )
+            return
         
-        # Create test data
-        test_item = {
-            'id': 'perf-test-id',
-            'data': 'x' * 1024,  # 1KB payload
-            'timestamp': int(time.time())
-        }
+        if operation not in ("write", "batch", "read"):
+            yield technical_response(
+                f"Unsupported operation: {operation}. Use 'write', 'batch', or 'read'.",
+                {'pattern': 'usage_error'}
+            )
+            return
         
-        # Test DynamoDB
-        dynamodb_latencies = []
-        dynamodb_start = time.time()
+        yield f"Performance Comparison: {operation} ({item_count} items)\n" + "=" * 50 + "\n\n"
         
-        table = self.connections.dynamodb.Table('perf-test')
-        for i in range(min(item_count, 100)):  # Cap at 100 for quick test
-            item = test_item.copy()
-            item['id'] = f'ddb-{i}'
-            
-            op_start = time.time()
-            if operation == "write":
-                table.put_item(Item=item)
-            elif operation == "read":
-                table.get_item(Key={'id': item['id']})
-            dynamodb_latencies.append((time.time() - op_start) * 1000)
-        
-        dynamodb_time = time.time() - dynamodb_start
-        
-        # Test ScyllaDB Alternator
-        scylla_latencies = []
-        scylla_start = time.time()
-        
-        table = self.connections.alternator.Table('perf-test')
-        for i in range(min(item_count, 100)):
-            item = test_item.copy()
-            item['id'] = f'scylla-{i}'
-            
-            op_start = time.time()
-            if operation == "write":
-                table.put_item(Item=item)
-            elif operation == "read":
-                table.get_item(Key={'id': item['id']})
-            scylla_latencies.append((time.time() - op_start) * 1000)
-        
-        scylla_time = time.time() - scylla_start
-        
-        # Calculate metrics
-        import statistics
-        
-        dynamodb_metrics = {
-            'avg_latency': statistics.mean(dynamodb_latencies),
-            'p99_ms': sorted(dynamodb_latencies)[int(len(dynamodb_latencies) * 0.99)],
-            'throughput': len(dynamodb_latencies) / dynamodb_time,
-            'throttled': 0  # Would need CloudWatch for real number
+        # Test data in low-level wire form, shared by both runs; only 'id' varies
+        base_item = {
+            'data': {'S': PERF_PAYLOAD},
+            'timestamp': {'N': str(int(time.time()))}
         }
         
-        scylla_metrics = {
-            'avg_latency': statistics.mean(scylla_latencies),
-            'p99_ms': sorted(scylla_latencies)[int(len(scylla_latencies) * 0.99)],
-            'throughput': len(scylla_latencies) / scylla_time,
+        # Test DynamoDB, then ScyllaDB Alternator (off the event loop);
+        # throttled would need CloudWatch for a real number
+        dynamodb_metrics = self._latency_metrics(*await asyncio.to_thread(
+            self._run_table_benchmark,
+            self.connections.dynamodb_client, 'ddb', operation, item_count, base_item
+        ))
+        yield "DynamoDB:\n" + PERF_METRICS_TEMPLATE.format_map(dynamodb_metrics)
+        
+        scylla_metrics = self._latency_metrics(*await asyncio.to_thread(
+            self._run_table_benchmark,
+            self.connections.alternator_client, 'scylla', operation, item_count, base_item
+        ))
+        yield "".join([
+            "\nScyllaDB Alternator:\n" + PERF_METRICS_TEMPLATE.format_map(scylla_metrics),
+            "  Throttled requests: 0 (hardware limits only)\n"
+        ])
+        
+        yield "".join([
+            "\n" + self.technical_advisor.explain_performance_delta(dynamodb_metrics, scylla_metrics),
+            # Add architecture insight
+            "\n\nArchitecture difference:\n",
+            "- DynamoDB: Request → LB → Storage nodes → Response\n",
+            "- ScyllaDB: Request → Shard (CPU + Memory + Storage) → Response\n",
+            "Fewer hops = lower latency\n"
+        ])
+    
+    @staticmethod
+    def _latency_metrics(latencies: List[float], elapsed: float) -> Dict[str, float]:
+        """Avg/P99 latency (ms) and throughput (ops/sec) for one benchmark run."""
+        if len(latencies) > 1:
+            p99 = statistics.quantiles(latencies, n=100, method='inclusive')[98]
+        else:
+            p99 = latencies[0]
+        return {
+            'avg_latency': statistics.fmean(latencies),
+            'p99_ms': p99,
+            'throughput': len(latencies) / elapsed,
             'throttled': 0
         }
+    
+    @staticmethod
+    def _run_table_benchmark(client, prefix: str, operation: str, item_count: int,
+                             base_item: dict, table_name: str = 'perf-test') -> Tuple[List[float], float]:
+        """
+        Run item_count ops against one table with many requests in flight.
         
-        # Format results
-        response += f"DynamoDB:\n"
-        response += f"  Avg latency: {dynamodb_metrics['avg_latency']:.1f}ms\n"
-        response += f"  P99 latency: {dynamodb_metrics['p99_ms']:.1f}ms\n"
-        response += f"  Throughput: {dynamodb_metrics['throughput']:.0f} ops/sec\n"
+        Writes go out as BatchWriteItem calls of PERF_BATCH_SIZE items, reads
+        as parallel GetItem calls. Returns per-item latencies (ms) and wall time (s);
+        a batched item's latency is the latency of its batch. base_item holds
+        every attribute except 'id', in low-level AttributeValue form.
+        """
+        # Low-level clients are thread-safe; base_item is already serialized
+        keys = [_shard_key(f'{prefix}-{i}') for i in range(item_count)]
+        latencies = [0.0] * item_count
         
-        response += f"\nScyllaDB Alternator:\n"
-        response += f"  Avg latency: {scylla_metrics['avg_latency']:.1f}ms\n"
-        response += f"  P99 latency: {scylla_metrics['p99_ms']:.1f}ms\n"
-        response += f"  Throughput: {scylla_metrics['throughput']:.0f} ops/sec\n"
-        response += f"  Throttled requests: 0 (hardware limits only)\n"
+        def write_batch(first: int) -> None:
+            batch = keys[first:first + PERF_BATCH_SIZE]
+            requests = [{'PutRequest': {'Item': {**base_item, 'id': {'S': key}}}} for key in batch]
+            op_start = time.perf_counter()
+            for attempt in itertools.count():
+                result = client.batch_write_item(RequestItems={table_name: requests})
+                requests = result.get('UnprocessedItems', {}).get(table_name, [])
+                if not requests:
+                    break
+                time.sleep(min(0.05 * 2 ** attempt, 1.0))  # back off on throttling
+            elapsed = (time.perf_counter() - op_start) * 1000
+            latencies[first:first + len(batch)] = [elapsed] * len(batch)
         
-        response += "\n" + self.technical_advisor.explain_performance_delta(
-            dynamodb_metrics, scylla_metrics
-        )
+        def read_item(i: int) -> None:
+            op_start = time.perf_counter()
+            client.get_item(TableName=table_name, Key={'id': {'S': keys[i]}})
+            latencies[i] = (time.perf_counter() - op_start) * 1000
         
-        # Add architecture insight
-        response += "\n\nArchitecture difference:\n"
-        response += "- DynamoDB: Request → LB → Storage nodes → Response\n"
-        response += "- ScyllaDB: Request → Shard (CPU + Memory + Storage) → Response\n"
-        response += "Fewer hops = lower latency\n"
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=PERF_MAX_WORKERS) as executor:
+            if operation == "read":
+                list(executor.map(read_item, range(item_count)))
+            else:
+                list(executor.map(write_batch, range(0, item_count, PERF_BATCH_SIZE)))
         
-        return response
+        return latencies, time.perf_counter() - start
     
     async def _handle_cost_estimate(self, reads_per_sec: int, writes_per_sec: int, 
                                    storage_gb: int, item_size_kb: float, pattern: str) -> str:
         """Calculate cost comparison."""
-        response = "Cost Analysis\n"
-        response += "=" * 50 + "\n\n"
-        
-        # DynamoDB costs (simplified)
-        read_units = reads_per_sec * 3600 * 24 * 30  # Monthly reads
-        write_units = writes_per_sec * 3600 * 24 * 30  # Monthly writes
-        
-        # Pricing (us-east-1)
-        read_cost = (read_units / 1_000_000) * 0.25
-        write_cost = (write_units / 1_000_000) * 1.25
-        storage_cost = storage_gb * 0.25
-        
-        dynamodb_total = read_cost + write_cost + storage_cost
-        
-        response += f"DynamoDB Monthly Cost:\n"
-        response += f"  Reads: ${read_cost:,.2f}\n"
-        response += f"  Writes: ${write_cost:,.2f}\n"
-        response += f"  Storage: ${storage_cost:,.2f}\n"
-        response += f"  Total: ${dynamodb_total:,.2f}\n"
-        
-        # ScyllaDB estimate (rough - depends on instance selection)
-        # Assuming i3.2xlarge can handle 50K ops/sec
-        total_ops = reads_per_sec + writes_per_sec
-        instances_needed = max(1, total_ops // 50000)
-        scylla_cost = instances_needed * 624  # i3.2xlarge monthly
+        # Prefer the detailed calculator when it is installed
+        if calculate_advanced_cost is not None:
+            try:
+                return _advanced_cost(
+                    reads_per_sec, writes_per_sec, storage_gb, item_size_kb, pattern
+                )
+            except Exception as e:
+                logger.warning(f"Advanced calculator failed: {e}, falling back to simple calculator")
         
-        response += f"\nScyllaDB Estimated Cost:\n"
-        response += f"  Instances: {instances_needed} × i3.2xlarge\n"
-        response += f"  Total: ${scylla_cost:,.2f}\n"
-        response += f"  Savings: ${dynamodb_total - scylla_cost:,.2f} ({((dynamodb_total - scylla_cost) / dynamodb_total * 100):.0f}%)\n"
+        parts = [_cost_summary(reads_per_sec, writes_per_sec, storage_gb)]
         
         # Add workload-specific analysis
         workload_context = {
@@ -582,18 +972,23 @@ class ScyllaDBMCPServer:
             'pattern': pattern
         }
         
-        response += self.technical_advisor.cost_analysis(workload_context)
+        parts.append(self.technical_advisor.cost_analysis(workload_context))
         
-        return response
+        return "".join(parts)
     
     async def _create_docker_container(self) -> str:
         """Create and start ScyllaDB Docker container."""
         try:
-            logger.info("Pulling ScyllaDB image...")
-            self.docker_client.images.pull("scylladb/scylla", tag="latest")
+            local_images = await asyncio.to_thread(
+                self.docker_client.images.list, name="scylladb/scylla:latest"
+            )
+            if not local_images:
+                logger.info("Pulling ScyllaDB image...")
+                await asyncio.to_thread(self.docker_client.images.pull, "scylladb/scylla", tag="latest")
             
             logger.info("Creating container...")
-            container = self.docker_client.containers.run(
+            container = await asyncio.to_thread(
+                self.docker_client.containers.run,
                 "scylladb/scylla:latest",
                 name="scylladb-mcp",
                 ports={
@@ -606,33 +1001,244 @@ class ScyllaDBMCPServer:
                 command="--smp 1 --memory 750M --overprovisioned 1"
             )
             
-            logger.info("Waiting for ScyllaDB to start...")
-            await asyncio.sleep(30)  # ScyllaDB needs time to initialize
-            
             self.connections.docker_container = container
             
+            logger.info("Waiting for ScyllaDB to start...")
+            if not await self._wait_for_cql():
+                return technical_response(
+                    f"Failed to start: ScyllaDB did not accept CQL connections within {CQL_READY_TIMEOUT:.0f}s.",
+                    {'pattern': 'setup_issue'}
+                )
+            
             return technical_response(
                 "Created ScyllaDB container. SMP=1 for laptop-friendly performance.",
                 {'pattern': 'docker_setup'}
             )
             
         except Exception as e:
-            return technical_response(
-                f"Failed to create container: {str(e)}",
-                {'pattern': 'error'}
-            )
+            return self._err(f"Failed to create container: {str(e)}")
+    
+    @staticmethod
+    async def _wait_for_cql(host: str = 'localhost', port: int = 9042,
+                            timeout: float = None) -> bool:
+        """Poll the CQL port with exponential backoff until it accepts connections."""
+        deadline = time.monotonic() + (timeout or CQL_READY_TIMEOUT)
+        for attempt in itertools.count():
+            try:
+                _, writer = await asyncio.wait_for(asyncio.open_connection(host, port), timeout=1.0)
+                writer.close()
+                return True
+            except (asyncio.TimeoutError, OSError):
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                await asyncio.sleep(min(0.2 * 2 ** attempt, 2.0, remaining))
+    
+    async def _handle_populate_data(self, source: str, table: str, rows: int) -> str:
+        """Populate test data with realistic patterns."""
+        if not self.connections.scylla:
+            return self._err("Not connected. Run 'connect' first.")
+        
+        try:
+            session = self.connections.scylla
+            await self._use_keyspace(session, DEMO_KEYSPACE)
+            
+            if source == "dynamodb_style":
+                # Create DynamoDB-style table
+                await self._execute_async(session, f"""
+                    CREATE TABLE IF NOT EXISTS {table} (
+                        pk text,
+                        sk text,
+                        data text,
+                        attributes map<text, text>,
+                        ttl int,
+                        PRIMARY KEY (pk, sk)
+                    )
+                """)
+                
+                # user_0..user_999 create some hot partitions on purpose
+                await self._insert_rows(
+                    session,
+                    f"INSERT INTO {table} (pk, sk, data) VALUES (?, ?, ?)",
+                    ((f"user_{i % 1000}", f"item_{i}", f"data_{i}" * 10) for i in range(rows))
+                )
+                
+                parts = [f"✅ Populated {table} with {rows} DynamoDB-style records\n\n"]
+                parts.append("Notice how user_0 through user_999 will create hot partitions? ")
+                parts.append("That's your typical DynamoDB anti-pattern right there.")
+                
+                return technical_response("".join(parts), {'pattern': 'hot_partition', 
+                                                  'metrics': {'heat_ratio': 0.9, 'ops_per_sec': 1000}})
+            
+            elif source == "ycsb":
+                # YCSB workload
+                await self._execute_async(session, f"""
+                    CREATE TABLE IF NOT EXISTS {table} (
+                        y_id varchar PRIMARY KEY,
+                        field0 varchar, field1 varchar, field2 varchar,
+                        field3 varchar, field4 varchar
+                    )
+                """)
+                
+                await self._insert_rows(
+                    session,
+                    f"INSERT INTO {table} (y_id, field0, field1, field2, field3, field4) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    ((f"user{i}", *(f"val{f}_{i}" for f in range(5))) for i in range(rows))
+                )
+                
+                return technical_response(
+                    f"✅ Populated {table} with {rows} YCSB records\n\n"
+                    "YCSB - the benchmark everyone games. At least it's consistent.",
+                    {'pattern': 'benchmark'}
+                )
+            
+            else:
+                return self._err(f"Source '{source}' not implemented. Pick something that exists.")
+                
+        except Exception as e:
+            return self._err(f"Failed to populate data: {str(e)}")
+    
+    @staticmethod
+    async def _insert_rows(session: Session, query: str, rows) -> None:
+        """Prepare query once and run it for every row, POPULATE_CONCURRENCY in flight."""
+        prepared = await asyncio.to_thread(session.prepare, query)
+        await asyncio.to_thread(
+            execute_concurrent_with_args, session, prepared, rows,
+            concurrency=POPULATE_CONCURRENCY, raise_on_first_error=True
+        )
+    
+    async def _handle_analyze_dynamodb_model(self, data_model: str, requirements: str = None) -> str:
+        """Analyze AWS DynamoDB MCP tool output with technical analysis."""
+        
+        parts = ["📋 **Analyzing AWS DynamoDB Model for ScyllaDB Migration**\n\n"]
+        
+        # Parse the model for patterns (lowercase once, reuse for every check)
+        model = data_model.lower()
+        hot_partition_risk = False
+        gsi_count = model.count('global secondary index')
+        has_streams = 'streams' in model
+        has_transactions = 'transact' in model
+        
+        # Look for fan-out patterns mentioned in AWS blog
+        if 'fan-out' in model:
+            hot_partition_risk = True
+            parts.append("⚠️ **Fan-out Pattern Detected**\n")
+            parts.append("DynamoDB: Batch limit 25 items → Streams → Lambda → More writes\n")
+            parts.append("Latency stack: Write + Stream lag + Lambda cold start + Fan-out\n")
+            parts.append("ScyllaDB: Single batch write. No external orchestration.\n")
+            parts.append("Latency: One network round-trip.\n\n")
+        
+        # Check for full-text search
+        if 'full-text search' in model or 'opensearch' in model:
+            parts.append("🔍 **Full-text Search Pattern**\n")
+            parts.append("External search cluster adds complexity and cost. ")
+            parts.append("Consider if secondary indexes suffice for your use case.\n\n")
+        
+        # GSI analysis
+        if gsi_count > 0:
+            parts.append(f"📊 **{gsi_count} Global Secondary Indexes**\n")
+            parts.append(f"Cost multiplication: {gsi_count + 1}× write costs\n")
+            parts.append(f"Storage multiplication: {gsi_count + 1}× storage costs\n")
+            parts.append(f"Consistency: Eventually consistent by default\n")
+            parts.append(f"ScyllaDB: Materialized views with ~20-30% overhead, strongly consistent\n\n")
+        
+        # Migration assessment
+        parts.append("🔄 **Migration Path**\n")
+        if has_transactions and has_streams:
+            complexity = "Complex"
+            effort = "2-4 weeks"
+            parts.append("- Transactions → Redesign for single-partition ops\n")
+            parts.append("- Streams → Change Data Capture (CDC)\n")
+        elif has_transactions or has_streams:
+            complexity = "Moderate" 
+            effort = "1-2 weeks"
+            if has_transactions:
+                parts.append("- Transactions limited to single partition in Alternator\n")
+            if has_streams:
+                parts.append("- Use CDC instead of Streams\n")
+        else:
+            complexity = "Simple"
+            effort = "< 1 week"
+            parts.append("- Straightforward port via Alternator API\n")
+            parts.append("- Just change the endpoint\n")
+        
+        parts.append(f"\nComplexity: {complexity}\n")
+        parts.append(f"Effort: {effort}\n\n")
+        
+        # Cost projection
+        parts.append("💰 **Cost Implications**\n")
+        if gsi_count > 2:
+            parts.append(f"With {gsi_count} GSIs, you're paying {gsi_count + 1}x for every write. ")
+            parts.append("ScyllaDB potential savings: 80%+\n")
+        elif hot_partition_risk:
+            parts.append("Hot partition patterns require over-provisioning in DynamoDB. ")
+            parts.append("ScyllaDB handles bursts to hardware limits. Savings: 60-80%\n")
+        else:
+            parts.append("Standard workload. Expect 40-70% savings depending on traffic patterns.\n")
+        
+        # Anti-patterns
+        parts.append("\n⚡ **Anti-patterns for ScyllaDB**\n")
+        
+        if 'uuid' in model and 'partition key' in model:
+            parts.append("- UUID as partition key = maximum scatter, zero locality\n")
+        
+        if 'scan' in model or requirements and 'scan' in requirements.lower():
+            parts.append("- Full table scans. Redesign with proper partition access.\n")
+        
+        if not hot_partition_risk and not has_transactions:
+            parts.append("- None detected. Clean design.\n")
+        
+        # Recommendation
+        parts.append("\n✅ **Recommendation**\n")
+        if complexity == "Simple":
+            parts.append("Easy migration. Run our cost estimator with your actual traffic numbers. ")
+            parts.append("Prepare for significant savings.\n")
+        else:
+            parts.append("Migration requires some redesign, but the ROI is clear. ")
+            parts.append("We've seen 5X-40X cost reductions in production.\n")
+        
+        # Add technical analysis
+        return technical_response("".join(parts), {
+            'pattern': 'aws_model_analysis',
+            'has_antipatterns': hot_partition_risk or (gsi_count > 3)
+        })
     
     async def run(self):
         """Run the MCP server."""
+        logger.info("🚀 Starting ScyllaDB MCP Server...")
+        
+        if os.getenv('SCYLLA_CONNECTION_MODE', 'docker') == 'docker':
+            logger.info("📦 Mode: Local Docker Development")
+            logger.info("   - Auto-provisioning ScyllaDB container")
+            logger.info("   - CQL port: 9042")
+        else:
+            logger.info("☁️  Mode: ScyllaDB Cloud")
+            logger.info("")
+            logger.info("⚠️  ScyllaDB Cloud Setup Tips:")
+            logger.info("   1. Choose 'CQL compatible' (NOT 'DynamoDB API only')")
+            logger.info("   2. Enable Alternator API in cluster settings")
+            logger.info("   3. Isolation Policy: 'Always use LWT' for DynamoDB compatibility")
+            logger.info("   4. Enable 'Extract Metrics' for performance monitoring")
+            logger.info("   5. This gives you BOTH CQL and DynamoDB APIs")
+        
         async with stdio_server() as (read_stream, write_stream):
-            await self.server.run(
-                read_stream,
-                write_stream,
-                InitializationOptions(
-                    server_name="scylladb-mcp",
-                    server_version="1.0.0"
+            # Connect in the background: an image pull plus the CQL wait can
+            # outlast the client's initialize timeout. An explicit connect
+            # call waits for it on _connect_lock.
+            startup = asyncio.create_task(self.create_connections())
+            startup.add_done_callback(_log_startup_connect)
+            try:
+                await self.server.run(
+                    read_stream,
+                    write_stream,
+                    InitializationOptions(
+                        server_name="scylladb-mcp",
+                        server_version="1.0.0"
+                    )
                 )
-            )
+            finally:
+                startup.cancel()
 
 
 def main():
@@ -1,18 +1,14 @@
 #!/usr/bin/env python3
 """Test all ScyllaDB Cloud nodes."""
 
-import os
-import json
-from cassandra.cluster import Cluster
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from cassandra.cluster import Cluster, ExecutionProfile, EXEC_PROFILE_DEFAULT
 from cassandra.auth import PlainTextAuthProvider
+from cassandra.policies import TokenAwarePolicy, DCAwareRoundRobinPolicy
 
-# Load config
-with open('../.claude/config.json', 'r') as f:
-    config = json.load(f)
-    env = config['mcpServers']['scylladb']['env']
-    for k, v in env.items():
-        if not k.startswith('//'):
-            os.environ[k] = v
+from config_loader import load_env
+
+load_env()
 
 # All three nodes
 nodes = [
@@ -28,18 +24,40 @@ print("Testing all ScyllaDB Cloud nodes...")
 
 auth_provider = PlainTextAuthProvider(username=username, password=password)
 
+# Seconds a node gets to accept the connection and answer the control queries;
+# bounds how long an unreachable node's probe can run
+CONNECT_TIMEOUT = 5
+
+def make_cluster(contact_points):
+    """Cluster with token-aware routing on protocol v4."""
+    # Route straight to a replica of each partition instead of via a random
+    # coordinator; a policy tracks one cluster's hosts, so never share it
+    profile = ExecutionProfile(load_balancing_policy=TokenAwarePolicy(DCAwareRoundRobinPolicy()))
+    return Cluster(
+        contact_points=contact_points,
+        auth_provider=auth_provider,
+        port=9042,
+        protocol_version=4,
+        connect_timeout=CONNECT_TIMEOUT,
+        control_connection_timeout=CONNECT_TIMEOUT,
+        execution_profiles={EXEC_PROFILE_DEFAULT: profile}
+    )
+
+
 try:
     # Try with all nodes
     print(f"\nTrying all nodes together...")
-    cluster = Cluster(
-        contact_points=nodes,
-        auth_provider=auth_provider,
-        port=9042
-    )
+    cluster = make_cluster(nodes)
     session = cluster.connect()
     print("✅ Connected successfully!")
+    # scylla-driver opens one connection per shard and routes to the owning one
+    if hasattr(cluster, 'is_shard_aware'):
+        print(f"   Shard-aware: {cluster.is_shard_aware()}")
+    else:
+        print("   Shard-aware: no (stock cassandra-driver; install scylla-driver)")
     
-    result = session.execute("SELECT cluster_name, release_version FROM system.local")
+    stmt = session.prepare("SELECT cluster_name, release_version FROM system.local")
+    result = session.execute(stmt)
     for row in result:
         print(f"   Cluster: {row.cluster_name}")
         print(f"   Version: {row.release_version}")
@@ -49,16 +67,29 @@ try:
 except Exception as e:
     print(f"❌ Failed: {e}")
     
-    # Try each node individually
-    for node in nodes:
-        print(f"\nTrying {node}...")
+    # Probe each node concurrently; the first successful handshake wins
+    def probe(node):
+        cluster = make_cluster([node])
         try:
-            cluster = Cluster([node], auth_provider=auth_provider, port=9042)
-            session = cluster.connect()
-            print(f"✅ Connected to {node}")
+            cluster.connect()
+        finally:
             cluster.shutdown()
-            break
-        except Exception as e:
-            print(f"❌ Failed: {e}")
+        return node
+    
+    print(f"\nTrying {len(nodes)} nodes individually...")
+    # No with-block, so the report continues after the first success. Probes
+    # already running can't be abandoned (the interpreter joins them at exit);
+    # CONNECT_TIMEOUT is what bounds that wait
+    ex = ThreadPoolExecutor(max_workers=len(nodes))
+    try:
+        futures = {ex.submit(probe, node): node for node in nodes}
+        for future in as_completed(futures):
+            node = futures[future]
+            if future.exception() is None:
+                print(f"✅ Connected to {node}")
+                break
+            print(f"❌ Failed {node}: {future.exception()}")
+    finally:
+        ex.shutdown(wait=False, cancel_futures=True)
 
 print("\nWhat does the Python tab in ScyllaDB Cloud show for connection code?")
\ No newline at end of file
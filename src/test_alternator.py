@@ -1,9 +1,10 @@
 #!/usr/bin/env python3
 """Test ScyllaDB Cloud Alternator (DynamoDB API) connection."""
 
-import boto3
 import json
 
+from demo_common import alternator_client, alternator_resource
+
 # Test both HTTP and HTTPS endpoints
 endpoints = {
     "HTTP": "http://node-0.aws-us-east-1.a17dfa2542149ef7642e.clusters.scylla.cloud:8000",
@@ -14,14 +15,8 @@ for protocol, endpoint in endpoints.items():
     print(f"\nTesting {protocol} endpoint: {endpoint}")
     
     try:
-        # Create DynamoDB client
-        dynamodb = boto3.client(
-            'dynamodb',
-            endpoint_url=endpoint,
-            region_name='us-east-1',  # ScyllaDB Cloud uses real region
-            aws_access_key_id='None',
-            aws_secret_access_key='None'
-        )
+        # Create DynamoDB client (ScyllaDB Cloud uses real region)
+        dynamodb = alternator_client(endpoint)
         
         # Try to list tables
         response = dynamodb.list_tables()
@@ -29,13 +24,7 @@ for protocol, endpoint in endpoints.items():
         print(f"   Tables: {response.get('TableNames', [])}")
         
         # Try the resource interface too
-        dynamodb_resource = boto3.resource(
-            'dynamodb',
-            endpoint_url=endpoint,
-            region_name='us-east-1',
-            aws_access_key_id='None',
-            aws_secret_access_key='None'
-        )
+        dynamodb_resource = alternator_resource(endpoint)
         
         # If no tables exist, this confirms we're connected
         print(f"   Connection successful - Alternator API is working!")
@@ -1,9 +1,11 @@
 #!/usr/bin/env python3
 """Test both DynamoDB and ScyllaDB Alternator connections."""
 
-import boto3
 import time
 import os
+from concurrent.futures import ThreadPoolExecutor
+
+from demo_common import SESSION, CFG, alternator_client
 
 # ScyllaDB Alternator endpoint
 SCYLLA_ENDPOINT = "http://node-0.aws-us-east-1.a17dfa2542149ef7642e.clusters.scylla.cloud:8000"
@@ -15,46 +17,43 @@ AWS_REGION = os.getenv('AWS_REGION', 'us-east-1')
 
 print("🔄 A/B Testing Setup\n")
 
-# Test 1: AWS DynamoDB
-print("1️⃣ Testing AWS DynamoDB...")
-try:
-    dynamodb_aws = boto3.client(
+
+def check_endpoint(label, client):
+    """Time list_tables() against one endpoint; returns the report lines."""
+    try:
+        client.list_tables()  # warm: TLS handshake, DNS, endpoint resolution
+        
+        start = time.perf_counter()
+        tables = client.list_tables()
+        latency = (time.perf_counter() - start) * 1000
+        
+        return [
+            f"✅ {label} connected!",
+            f"   Latency: {latency:.1f}ms",
+            f"   Tables: {len(tables.get('TableNames', []))}"
+        ]
+    except Exception as e:
+        return [f"❌ {label} failed: {e}"]
+
+
+endpoints = [
+    ("1️⃣ Testing AWS DynamoDB...", "AWS DynamoDB", SESSION.client(
         'dynamodb',
         region_name=AWS_REGION,
         aws_access_key_id=AWS_KEY,
-        aws_secret_access_key=AWS_SECRET
-    )
-    
-    start = time.time()
-    tables = dynamodb_aws.list_tables()
-    latency = (time.time() - start) * 1000
-    
-    print(f"✅ AWS DynamoDB connected!")
-    print(f"   Latency: {latency:.1f}ms")
-    print(f"   Tables: {len(tables.get('TableNames', []))}")
-except Exception as e:
-    print(f"❌ AWS DynamoDB failed: {e}")
-
-# Test 2: ScyllaDB Alternator
-print("\n2️⃣ Testing ScyllaDB Alternator...")
-try:
-    dynamodb_scylla = boto3.client(
-        'dynamodb',
-        endpoint_url=SCYLLA_ENDPOINT,
-        region_name='us-east-1',
-        aws_access_key_id='None',
-        aws_secret_access_key='None'
-    )
-    
-    start = time.time()
-    tables = dynamodb_scylla.list_tables()
-    latency = (time.time() - start) * 1000
-    
-    print(f"✅ ScyllaDB Alternator connected!")
-    print(f"   Latency: {latency:.1f}ms")
-    print(f"   Tables: {len(tables.get('TableNames', []))}")
-except Exception as e:
-    print(f"❌ ScyllaDB Alternator failed: {e}")
+        aws_secret_access_key=AWS_SECRET,
+        config=CFG
+    )),
+    ("\n2️⃣ Testing ScyllaDB Alternator...", "ScyllaDB Alternator", alternator_client(SCYLLA_ENDPOINT)),
+]
+
+# Probe both endpoints concurrently, then report in order
+with ThreadPoolExecutor(max_workers=2) as ex:
+    reports = list(ex.map(lambda e: check_endpoint(e[1], e[2]), endpoints))
+
+for (heading, _, _), lines in zip(endpoints, reports):
+    print(heading)
+    print("\n".join(lines))
 
 print("\n✅ Both connections ready for A/B testing!")
 print("\nNext: Update your AWS credentials in .claude/config.json")
\ No newline at end of file
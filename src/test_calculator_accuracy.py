@@ -1,9 +1,37 @@
 #!/usr/bin/env python3
 """Test calculator accuracy against known ScyllaDB calculator results."""
 
+import os
+import re
+import sys
+from functools import lru_cache
+
 from advanced_cost_calculator import ScyllaDBCostCalculator, WorkloadProfile, CostParameters
 from calculator_from_csv import calculate_from_csv
 
+# Totals in calculate_from_csv output; the first TOTAL line is DynamoDB's,
+# the first one after SCYLLA_HEADER is ScyllaDB's
+_TOTAL_RE = re.compile(r'TOTAL: \$([0-9,]+\.[0-9]+)/month')
+SCYLLA_HEADER = 'ScyllaDB Monthly Costs:'
+
+BASELINE_CSV = '../baselinePeak.csv'
+
+# Parameters test_calculator_url expects in the URL, matched in one scan
+_URL_NEEDLES = (
+    'baselineReads=100000',
+    'baselineWrites=200000',
+    'peakReads=250000',
+    'peakWrites=500000',
+    'storageGB=512'
+)
+_URL_NEEDLES_RE = re.compile('|'.join(map(re.escape, _URL_NEEDLES)))
+
+
+@lru_cache(maxsize=8)
+def _cached_calc(path: str, mtime: float, storage_gb: int) -> str:
+    """calculate_from_csv, reparsed only when the file changes (mtime is the key)."""
+    return calculate_from_csv(path, storage_gb=storage_gb)
+
 
 def test_against_baseline_csv():
     """Test our calculator against the baselinePeak.csv from ScyllaDB."""
@@ -20,13 +48,13 @@ def test_against_baseline_csv():
         'instance_count': 36
     }
     
-    result = calculate_from_csv('../baselinePeak.csv', storage_gb=512)
+    result = _cached_calc(BASELINE_CSV, os.path.getmtime(BASELINE_CSV), 512)
     print(result)
     
     # Extract numbers from result
-    import re
-    dynamodb_match = re.search(r'TOTAL: \$([0-9,]+\.[0-9]+)/month', result)
-    scylladb_match = re.search(r'ScyllaDB Monthly Costs:.*?TOTAL: \$([0-9,]+\.[0-9]+)/month', result, re.DOTALL)
+    dynamodb_match = _TOTAL_RE.search(result)
+    _, sep, scylla_tail = result.partition(SCYLLA_HEADER)
+    scylladb_match = _TOTAL_RE.search(scylla_tail) if sep else None
     
     if dynamodb_match:
         calculated_dynamodb = float(dynamodb_match.group(1).replace(',', ''))
@@ -115,15 +143,16 @@ def test_calculator_url():
     print(f"Generated URL: {url[:200]}...")
     
     # Check key parameters in URL
-    assert 'baselineReads=100000' in url
-    assert 'baselineWrites=200000' in url
-    assert 'peakReads=250000' in url
-    assert 'peakWrites=500000' in url
-    assert 'storageGB=512' in url
+    missing = set(_URL_NEEDLES).difference(_URL_NEEDLES_RE.findall(url))
+    assert not missing, f"missing from URL: {sorted(missing)}"
     print("✓ URL parameters correct")
 
 
 if __name__ == "__main__":
-    test_against_baseline_csv()
-    test_simple_workload()
-    test_calculator_url()
\ No newline at end of file
+    # Block-buffer stdout; each test's report goes out in one write
+    sys.stdout.reconfigure(line_buffering=False)
+    for test in (test_against_baseline_csv, test_simple_workload, test_calculator_url):
+        try:
+            test()
+        finally:
+            sys.stdout.flush()
\ No newline at end of file
@@ -3,6 +3,7 @@
 
 import boto3
 import os
+from botocore.config import Config
 from botocore.exceptions import ClientError
 
 # You'll need to set these
@@ -19,14 +20,19 @@ if AWS_ACCESS_KEY_ID == 'your-access-key':
     print("   export AWS_SECRET_ACCESS_KEY='your-actual-secret'")
     exit(1)
 
+# One session for the script; any further clients reuse its loaded service models
+_SESSION = boto3.session.Session(
+    region_name=AWS_REGION,
+    aws_access_key_id=AWS_ACCESS_KEY_ID,
+    aws_secret_access_key=AWS_SECRET_ACCESS_KEY
+)
+
+# Short timeouts and few retries so a bad network fails fast
+CFG = Config(connect_timeout=3, read_timeout=5, retries={'max_attempts': 2})
+
 try:
     # Create DynamoDB client
-    dynamodb = boto3.client(
-        'dynamodb',
-        region_name=AWS_REGION,
-        aws_access_key_id=AWS_ACCESS_KEY_ID,
-        aws_secret_access_key=AWS_SECRET_ACCESS_KEY
-    )
+    dynamodb = _SESSION.client('dynamodb', config=CFG)
     
     # List tables (might be empty)
     response = dynamodb.list_tables()
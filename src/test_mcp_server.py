@@ -1,36 +1,19 @@
 #!/usr/bin/env python3
 """Test the ScyllaDB MCP Server functionality directly."""
 
+import atexit
 import os
+import tempfile
 os.environ['CASS_DRIVER_NO_ASYNCORE'] = '1'
 os.environ['CASS_DRIVER_NO_TWISTED'] = '1'
 os.environ['CASS_DRIVER_NO_LIBEV'] = '1'
 
 import asyncio
+import sys
 from scylladb_mcp_server_fixed import ScyllaDBMCPServer
 
 
-async def test_advisor():
-    """Test the advisor functionality directly."""
-    server = ScyllaDBMCPServer()
-    
-    print("ScyllaDB MCP Server - Technical Advisor Test")
-    print("=" * 50)
-    
-    # Test 1: Cost Estimation
-    print("\n1. Cost Estimation Test:")
-    result = await server._handle_cost_estimate(
-        reads_per_sec=10000,
-        writes_per_sec=5000,
-        storage_gb=500,
-        item_size_kb=1,
-        pattern="steady"
-    )
-    print(result)
-    
-    # Test 2: Migration Check
-    print("\n2. Migration Assessment Test:")
-    sample_code = """
+SAMPLE_CODE = """
     import boto3
     
     dynamodb = boto3.resource('dynamodb')
@@ -54,19 +37,44 @@ async def test_advisor():
         ]
     )
     """
+_SAMPLE_BYTES = SAMPLE_CODE.encode('utf-8')
+
+
+async def test_advisor():
+    """Test the advisor functionality directly."""
+    server = ScyllaDBMCPServer()
     
-    result = await server._handle_check_migration(sample_code, "python")
-    print(result)
+    print("ScyllaDB MCP Server - Technical Advisor Test")
+    print("=" * 50)
     
-    # Test 3: Workload Analysis
-    print("\n3. Workload Analysis Test:")
-    # Create a temporary file for analysis
-    test_file = "/tmp/test_dynamodb_code.py"
-    with open(test_file, 'w') as f:
-        f.write(sample_code)
+    # Unique temp file for the workload analysis, so parallel runs don't collide
+    with tempfile.NamedTemporaryFile(mode='wb', suffix='.py', delete=False) as tf:
+        tf.write(_SAMPLE_BYTES)
+    test_file = tf.name
+    atexit.register(os.unlink, test_file)
     
-    result = await server._handle_analyze_workload(test_file, True)
-    print(result)
+    # The three handlers are independent and share no mutable server
+    # state, so run them concurrently and print in order afterwards
+    cost, migration, workload = await asyncio.gather(
+        server._handle_cost_estimate(
+            reads_per_sec=10000,
+            writes_per_sec=5000,
+            storage_gb=500,
+            item_size_kb=1,
+            pattern="steady"
+        ),
+        server._handle_check_migration(SAMPLE_CODE, "python"),
+        server._handle_analyze_workload(test_file, True)
+    )
+    
+    print("\n1. Cost Estimation Test:")
+    print(cost)
+    
+    print("\n2. Migration Assessment Test:")
+    print(migration)
+    
+    print("\n3. Workload Analysis Test:")
+    print(workload)
     
     print("\n" + "=" * 50)
     print("Technical Advisor is working correctly!")
@@ -78,4 +86,6 @@ async def test_advisor():
 
 
 if __name__ == "__main__":
+    # Block-buffer stdout; the report is flushed once at exit, not per line
+    sys.stdout.reconfigure(line_buffering=False)
     asyncio.run(test_advisor())
\ No newline at end of file
@@ -2,13 +2,16 @@
 """Test different ports for ScyllaDB Cloud."""
 
 import socket
-import os
-import json
+import sys
+from concurrent.futures import ThreadPoolExecutor
 
-# Load config
-with open('../.claude/config.json', 'r') as f:
-    config = json.load(f)
-    env = config['mcpServers']['scylladb']['env']
+from config_loader import load_env
+
+if __name__ == '__main__':
+    # Block-buffer stdout when run as a script; importers keep their own stdout
+    sys.stdout.reconfigure(line_buffering=False)
+
+load_env()
 
 host = "node-0.aws-us-east-1.a17dfa2542149ef7642e.clusters.scylla.cloud"
 print(f"Testing ports for: {host}")
@@ -16,20 +19,27 @@ print(f"Testing ports for: {host}")
 # Common CQL and ScyllaDB Cloud ports
 ports_to_test = [9042, 9142, 443, 9043, 10000]
 
-for port in ports_to_test:
+
+def probe(port):
+    """Connect to one port; returns the line to report."""
     sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
     sock.settimeout(5)
     try:
         result = sock.connect_ex((host, port))
         if result == 0:
-            print(f"✅ Port {port} is OPEN")
-        else:
-            print(f"❌ Port {port} is closed/filtered")
+            return f"✅ Port {port} is OPEN"
+        return f"❌ Port {port} is closed/filtered"
     except Exception as e:
-        print(f"❌ Port {port} error: {e}")
+        return f"❌ Port {port} error: {e}"
     finally:
         sock.close()
 
+
+# All probes at once: a filtered host costs one 5s timeout, not one per port
+with ThreadPoolExecutor(max_workers=len(ports_to_test)) as ex:
+    for line in ex.map(probe, ports_to_test):
+        print(line)
+
 print("\nNote: ScyllaDB Cloud might use:")
 print("- Port 9042 for standard CQL")
 print("- Port 9142 for CQL with SSL/TLS")
@@ -3,19 +3,12 @@
 
 import os
 import sys
-import json
+from ssl import CERT_REQUIRED, PROTOCOL_TLS_CLIENT, SSLContext
+
+from config_loader import load_env
 
 # Load config from .claude directory
-config_path = '../.claude/config.json'
-if os.path.exists(config_path):
-    with open(config_path, 'r') as f:
-        config = json.load(f)
-        env = config['mcpServers']['scylladb']['env']
-        
-        # Set environment variables
-        for key, value in env.items():
-            if not key.startswith('//'):
-                os.environ[key] = value
+load_env()
 
 # Must set BEFORE importing cassandra
 os.environ.setdefault('CASS_DRIVER_NO_CYTHON', '1')
@@ -25,6 +18,12 @@ from cassandra.cluster import Cluster, ExecutionProfile, EXEC_PROFILE_DEFAULT
 from cassandra.auth import PlainTextAuthProvider
 from cassandra.policies import WhiteListRoundRobinPolicy
 
+# One TLS context for every connection attempt. TLS_CLIENT defaults to
+# hostname checks; keep those off as before, then require a valid cert
+_SSL_CTX = SSLContext(PROTOCOL_TLS_CLIENT)
+_SSL_CTX.check_hostname = False
+_SSL_CTX.verify_mode = CERT_REQUIRED
+
 print(f"🔧 Testing ScyllaDB Cloud connection...")
 print(f"   Host: {os.getenv('SCYLLA_HOST', 'Not set')}")
 print(f"   Username: {os.getenv('SCYLLA_USERNAME', 'Not set')}")
@@ -46,18 +45,12 @@ if os.getenv('SCYLLA_IS_DOCKER', 'true').lower() != 'true':
             load_balancing_policy=WhiteListRoundRobinPolicy([host])
         )
         
-        # Try with SSL first
-        from ssl import CERT_REQUIRED, PROTOCOL_TLS, SSLContext
-        ssl_context = SSLContext(PROTOCOL_TLS)
-        ssl_context.check_hostname = False
-        ssl_context.verify_mode = CERT_REQUIRED
-        
         cluster = Cluster(
             contact_points=[host],
             auth_provider=auth_provider,
             protocol_version=4,
             port=9042,
-            ssl_context=ssl_context,
+            ssl_context=_SSL_CTX,
             execution_profiles={EXEC_PROFILE_DEFAULT: profile}
         )
         
@@ -75,7 +68,9 @@ if os.getenv('SCYLLA_IS_DOCKER', 'true').lower() != 'true':
     except Exception as e:
         print(f"❌ Connection failed: {e}")
         print(f"\nError type: {type(e).__name__}")
-        import traceback
-        traceback.print_exc()
+        # Full stack only on request; set SCYLLA_DEBUG=1 for diagnostics
+        if os.getenv('SCYLLA_DEBUG'):
+            import traceback
+            traceback.print_exc()
 else:
     print("📦 Docker mode is enabled. Switch SCYLLA_IS_DOCKER to 'false' to test cloud.")
\ No newline at end of file
@@ -2,15 +2,10 @@
 """Simple ScyllaDB Cloud connection test."""
 
 import os
-import json
-
-# Load config
-with open('../.claude/config.json', 'r') as f:
-    config = json.load(f)
-    env = config['mcpServers']['scylladb']['env']
-    for k, v in env.items():
-        if not k.startswith('//'):
-            os.environ[k] = v
+
+from config_loader import load_env
+
+load_env()
 
 from cassandra.cluster import Cluster
 from cassandra.auth import PlainTextAuthProvider
@@ -5,11 +5,15 @@ real production workloads from companies like Discord, Comcast, and
 Palo Alto Networks.
 """
 
-from typing import Dict, Tuple
+from typing import Dict, Mapping, Tuple
 from dataclasses import dataclass
+from functools import lru_cache
+from types import MappingProxyType
 
+from advanced_cost_calculator import ScyllaDBCostCalculator, WorkloadProfile, CostParameters
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class ApplicationProfile:
     """Represents a typical application workload profile."""
     name: str
@@ -20,8 +24,8 @@ class ApplicationProfile:
     peak_writes: int
     storage_gb: int
     item_size_kb: float
-    peak_hours: list  # Hours when peak occurs
-    example_companies: list
+    peak_hours: Tuple[int, ...]  # Hours when peak occurs
+    example_companies: Tuple[str, ...]
     scylladb_sweet_spot: bool  # True if this is ideal for ScyllaDB
     
 
@@ -38,8 +42,8 @@ APPLICATION_PROFILES = {
         peak_writes=80000,
         storage_gb=50000,  # 50TB
         item_size_kb=1,
-        peak_hours=[16, 17, 18, 19, 20, 21, 22, 23],  # Evening gaming/social
-        example_companies=["Discord", "Gaming chat", "Social platforms"],
+        peak_hours=(16, 17, 18, 19, 20, 21, 22, 23),  # Evening gaming/social
+        example_companies=("Discord", "Gaming chat", "Social platforms"),
         scylladb_sweet_spot=True
     ),
     
@@ -52,8 +56,8 @@ APPLICATION_PROFILES = {
         peak_writes=250000,
         storage_gb=10000,
         item_size_kb=0.5,
-        peak_hours=list(range(6, 22)),  # All day
-        example_companies=["DSP platforms", "Ad exchanges", "RTB systems"],
+        peak_hours=tuple(range(6, 22)),  # All day
+        example_companies=("DSP platforms", "Ad exchanges", "RTB systems"),
         scylladb_sweet_spot=True
     ),
     
@@ -66,8 +70,8 @@ APPLICATION_PROFILES = {
         peak_writes=500000,
         storage_gb=100000,  # 100TB
         item_size_kb=2,
-        peak_hours=list(range(24)),  # 24/7 threats
-        example_companies=["Palo Alto Networks", "CrowdStrike", "SentinelOne"],
+        peak_hours=tuple(range(24)),  # 24/7 threats
+        example_companies=("Palo Alto Networks", "CrowdStrike", "SentinelOne"),
         scylladb_sweet_spot=True
     ),
     
@@ -80,8 +84,8 @@ APPLICATION_PROFILES = {
         peak_writes=1000000,
         storage_gb=500000,  # 500TB
         item_size_kb=0.1,
-        peak_hours=list(range(6, 23)),  # Daytime activity
-        example_companies=["Comcast Xfinity", "Smart city platforms", "Industrial IoT"],
+        peak_hours=tuple(range(6, 23)),  # Daytime activity
+        example_companies=("Comcast Xfinity", "Smart city platforms", "Industrial IoT"),
         scylladb_sweet_spot=True
     ),
     
@@ -94,8 +98,8 @@ APPLICATION_PROFILES = {
         peak_writes=150000,
         storage_gb=20000,
         item_size_kb=2,
-        peak_hours=[19, 20, 21, 22],  # Prime time
-        example_companies=["Disney+ Hotstar", "Live sports streaming", "Twitch analytics"],
+        peak_hours=(19, 20, 21, 22),  # Prime time
+        example_companies=("Disney+ Hotstar", "Live sports streaming", "Twitch analytics"),
         scylladb_sweet_spot=True
     ),
     
@@ -110,8 +114,8 @@ APPLICATION_PROFILES = {
         peak_writes=20000,
         storage_gb=5000,
         item_size_kb=1,
-        peak_hours=[9, 10, 11, 14, 15, 16],  # Trading hours
-        example_companies=["Robinhood-scale", "Crypto exchanges", "Payment processors"],
+        peak_hours=(9, 10, 11, 14, 15, 16),  # Trading hours
+        example_companies=("Robinhood-scale", "Crypto exchanges", "Payment processors"),
         scylladb_sweet_spot=True
     ),
     
@@ -124,8 +128,8 @@ APPLICATION_PROFILES = {
         peak_writes=50000,
         storage_gb=10000,
         item_size_kb=1,
-        peak_hours=[18, 19, 20, 21, 22, 23],  # Evening gaming
-        example_companies=["Epic Games scale", "MMO games", "Battle royale"],
+        peak_hours=(18, 19, 20, 21, 22, 23),  # Evening gaming
+        example_companies=("Epic Games scale", "MMO games", "Battle royale"),
         scylladb_sweet_spot=True
     ),
     
@@ -140,8 +144,8 @@ APPLICATION_PROFILES = {
         peak_writes=7500,
         storage_gb=2000,
         item_size_kb=5,
-        peak_hours=[11, 12, 13, 14, 18, 19, 20, 21, 22],
-        example_companies=["Mid-market retailer", "Flash sale sites", "B2B marketplace"],
+        peak_hours=(11, 12, 13, 14, 18, 19, 20, 21, 22),
+        example_companies=("Mid-market retailer", "Flash sale sites", "B2B marketplace"),
         scylladb_sweet_spot=True  # Cost savings justify migration
     ),
     
@@ -154,8 +158,8 @@ APPLICATION_PROFILES = {
         peak_writes=10000,
         storage_gb=5000,
         item_size_kb=10,
-        peak_hours=[9, 10, 11, 13, 14, 15, 16],
-        example_companies=["Analytics platforms", "Business intelligence", "CRM at scale"],
+        peak_hours=(9, 10, 11, 13, 14, 15, 16),
+        example_companies=("Analytics platforms", "Business intelligence", "CRM at scale"),
         scylladb_sweet_spot=True
     ),
     
@@ -170,8 +174,8 @@ APPLICATION_PROFILES = {
         peak_writes=250,
         storage_gb=100,
         item_size_kb=2,
-        peak_hours=[9, 10, 11, 12, 13, 14, 15, 16, 17],
-        example_companies=["MVP", "Small SaaS", "Local apps"],
+        peak_hours=(9, 10, 11, 12, 13, 14, 15, 16, 17),
+        example_companies=("MVP", "Small SaaS", "Local apps"),
         scylladb_sweet_spot=False
     )
 }
@@ -182,71 +186,112 @@ def get_scylladb_recommendations() -> Dict[str, ApplicationProfile]:
     return {k: v for k, v in APPLICATION_PROFILES.items() if v.scylladb_sweet_spot}
 
 
-def calculate_savings_for_profile(profile_id: str) -> Dict[str, float]:
-    """Calculate potential savings for a specific profile."""
-    from advanced_cost_calculator import ScyllaDBCostCalculator, WorkloadProfile, CostParameters
-    
-    profile = APPLICATION_PROFILES.get(profile_id)
-    if not profile:
-        return {}
-    
-    # Create workload profile
-    workload = WorkloadProfile(
-        baseline_reads=profile.baseline_reads,
-        baseline_writes=profile.baseline_writes,
-        peak_reads=profile.peak_reads,
-        peak_writes=profile.peak_writes,
-        peak_read_hours=profile.peak_hours,
-        peak_write_hours=profile.peak_hours
+# The calculator holds no per-call state; one instance serves every profile
+_CALCULATOR = ScyllaDBCostCalculator()
+
+# Calculator inputs per profile, built once; profiles never change at runtime
+_PROFILE_INPUTS: Dict[str, Tuple[WorkloadProfile, CostParameters]] = {
+    profile_id: (
+        WorkloadProfile(
+            baseline_reads=p.baseline_reads,
+            baseline_writes=p.baseline_writes,
+            peak_reads=p.peak_reads,
+            peak_writes=p.peak_writes,
+            peak_read_hours=list(p.peak_hours),
+            peak_write_hours=list(p.peak_hours)
+        ),
+        CostParameters(
+            storage_gb=p.storage_gb,
+            item_size_bytes=int(p.item_size_kb * 1024)
+        )
     )
+    for profile_id, p in APPLICATION_PROFILES.items()
+}
+
+
+def calculate_savings_for_profile(profile_id: str) -> Dict[str, float]:
+    """Calculate potential savings for a specific profile (a fresh dict per call)."""
+    return dict(_savings_for_profile(profile_id))
+
+
+@lru_cache(maxsize=32)
+def _savings_for_profile(profile_id: str) -> Mapping[str, float]:
+    """
+    Memoized calculate_savings_for_profile body.
     
-    # Set parameters
-    params = CostParameters(
-        storage_gb=profile.storage_gb,
-        item_size_bytes=int(profile.item_size_kb * 1024)
-    )
+    Profiles are fixed, so results are cached per profile_id and kept
+    read-only (the same mapping is shared by every caller).
+    """
+    inputs = _PROFILE_INPUTS.get(profile_id)
+    if not inputs:
+        return MappingProxyType({})
+    workload, params = inputs
     
     # Calculate costs
-    calculator = ScyllaDBCostCalculator()
-    dynamodb_costs = calculator.calculate_dynamodb_cost(workload, params)
-    scylladb_costs = calculator.calculate_scylladb_cost(workload, params)
+    dynamodb_costs = _CALCULATOR.calculate_dynamodb_cost(workload, params)
+    scylladb_costs = _CALCULATOR.calculate_scylladb_cost(workload, params)
     
-    return {
+    return MappingProxyType({
         'dynamodb_monthly': dynamodb_costs['total'],
         'scylladb_monthly': scylladb_costs['total'],
         'savings_monthly': dynamodb_costs['total'] - scylladb_costs['total'],
         'savings_percent': ((dynamodb_costs['total'] - scylladb_costs['total']) / 
                            dynamodb_costs['total'] * 100) if dynamodb_costs['total'] > 0 else 0,
         'scylladb_config': f"{scylladb_costs['instance_count']}x {scylladb_costs['instance_type']}"
-    }
+    })
 
 
-def format_profile_with_savings(profile_id: str) -> str:
-    """Format profile with calculated savings."""
-    profile = APPLICATION_PROFILES.get(profile_id)
-    if not profile:
-        return "Unknown profile"
-    
-    savings = calculate_savings_for_profile(profile_id)
-    
-    return f"""
-📱 {profile.name}
-{profile.description}
+# Rendered by format_map; static profile fields come from _PROFILE_FIELDS,
+# the rest from _savings_for_profile
+PROFILE_TEMPLATE = """
+📱 {name}
+{description}
 
 Real-world examples:
-{', '.join(profile.example_companies)}
+{examples}
 
 📊 Workload Characteristics:
-- Baseline: {profile.baseline_reads:,} reads/sec, {profile.baseline_writes:,} writes/sec  
-- Peak: {profile.peak_reads:,} reads/sec, {profile.peak_writes:,} writes/sec
-- Storage: {profile.storage_gb:,}GB
-- Peak hours: {len(profile.peak_hours)} hours/day
+- Baseline: {baseline_reads:,} reads/sec, {baseline_writes:,} writes/sec  
+- Peak: {peak_reads:,} reads/sec, {peak_writes:,} writes/sec
+- Storage: {storage_gb:,}GB
+- Peak hours: {peak_hour_count} hours/day
 
 💰 Cost Analysis:
-- DynamoDB: ${savings['dynamodb_monthly']:,.2f}/month
-- ScyllaDB: ${savings['scylladb_monthly']:,.2f}/month ({savings['scylladb_config']})
-- Monthly savings: ${savings['savings_monthly']:,.2f} ({savings['savings_percent']:.0f}% reduction)
-- Annual savings: ${savings['savings_monthly'] * 12:,.2f}
+- DynamoDB: ${dynamodb_monthly:,.2f}/month
+- ScyllaDB: ${scylladb_monthly:,.2f}/month ({scylladb_config})
+- Monthly savings: ${savings_monthly:,.2f} ({savings_percent:.0f}% reduction)
+- Annual savings: ${savings_annual:,.2f}
+
+{verdict}
+"""
+
+# Template fields that depend only on the profile, joined once at import
+_PROFILE_FIELDS: Dict[str, Mapping[str, object]] = {
+    profile_id: MappingProxyType({
+        'name': p.name,
+        'description': p.description,
+        'examples': ', '.join(p.example_companies),
+        'baseline_reads': p.baseline_reads,
+        'baseline_writes': p.baseline_writes,
+        'peak_reads': p.peak_reads,
+        'peak_writes': p.peak_writes,
+        'storage_gb': p.storage_gb,
+        'peak_hour_count': len(p.peak_hours),
+        'verdict': ("✅ IDEAL for ScyllaDB - Designed for this scale!" if p.scylladb_sweet_spot
+                    else "⚠️  May be too small for ScyllaDB - consider managed services")
+    })
+    for profile_id, p in APPLICATION_PROFILES.items()
+}
+
 
-{"✅ IDEAL for ScyllaDB - Designed for this scale!" if profile.scylladb_sweet_spot else "⚠️  May be too small for ScyllaDB - consider managed services"}
-"""
\ No newline at end of file
+def format_profile_with_savings(profile_id: str) -> str:
+    """Format profile with calculated savings."""
+    if profile_id not in _PROFILE_FIELDS:
+        return "Unknown profile"
+    
+    savings = _savings_for_profile(profile_id)
+    return PROFILE_TEMPLATE.format_map({
+        **_PROFILE_FIELDS[profile_id],
+        **savings,
+        'savings_annual': savings['savings_monthly'] * 12
+    })
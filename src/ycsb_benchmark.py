@@ -2,10 +2,12 @@
 """YCSB Benchmark: DynamoDB vs ScyllaDB"""
 
 import boto3
+from botocore.config import Config
 import time
 import random
 import string
-import statistics
+import sys
+from collections import Counter
 from concurrent.futures import ThreadPoolExecutor
 import threading
 
@@ -21,6 +23,23 @@ OPERATION_COUNT = 1000
 READ_PROPORTION = 0.5  # 50% reads, 50% writes
 FIELD_COUNT = 10
 FIELD_LENGTH = 100
+LOAD_WORKERS = 10  # Loader threads in the load phase
+RUN_WORKERS = 32  # Concurrent clients in the run phase
+SINGLE_THREAD = '--single-thread' in sys.argv  # Classic YCSB: one client thread
+BATCH_LOAD = '--no-batch' not in sys.argv  # Load with BatchWriteItem instead of PutItem
+LOAD_BATCH_SIZE = 25  # BatchWriteItem's per-request item limit
+UNPROCESSED_BACKOFF_BASE = 0.05  # Seconds before the first UnprocessedItems resend, doubling
+UNPROCESSED_BACKOFF_CAP = 1.0  # Longest wait between UnprocessedItems resends, in seconds
+WARMUP_COUNT = int(os.getenv('YCSB_WARMUP', '50'))  # Untimed put/get pairs per platform
+TAIL_PERCENTILES = (90, 95, 99, 99.9)  # Tail latencies to report, in percent
+OP_TYPES = ('read', 'update')  # Run-phase operation types, reported separately
+NS_PER_MS = 1_000_000  # Latencies are recorded in integer ns, reported in ms
+HIST_PRECISION_BITS = 10  # Histogram keeps the top 10 bits of each ns value (~0.1%)
+
+# Field values are slices of one 1 MiB random alphanumeric string; one RNG call
+# per field instead of FIELD_LENGTH, and plenty distinct for YCSB payloads
+_ALPHABET = string.ascii_letters + string.digits
+_VALUE_POOL = ''.join(random.choices(_ALPHABET, k=1 << 20))
 
 print("🔬 YCSB Benchmark: DynamoDB vs ScyllaDB")
 print("=" * 50)
@@ -30,20 +49,46 @@ print(f"Read/Write: {int(READ_PROPORTION*100)}%/{int((1-READ_PROPORTION)*100)}%"
 print(f"Fields per record: {FIELD_COUNT}")
 print(f"Field size: {FIELD_LENGTH} bytes\n")
 
-# Create clients
-aws_client = boto3.resource('dynamodb',
-    region_name='us-east-1',
-    aws_access_key_id=AWS_KEY,
-    aws_secret_access_key=AWS_SECRET
-)
+# One session per process, shared by every worker thread through its resources
+SESSION = boto3.session.Session(region_name='us-east-1')
 
-scylla_client = boto3.resource('dynamodb',
-    endpoint_url=SCYLLA_ENDPOINT,
-    region_name='us-east-1',
-    aws_access_key_id='fake',
-    aws_secret_access_key='fake'
+# Keep-alive pool at twice the busiest phase's workers, so no thread waits for
+# a socket; adaptive retries back off if the table throttles
+CFG = Config(
+    max_pool_connections=max(32, 2 * max(LOAD_WORKERS, RUN_WORKERS)),
+    tcp_keepalive=True,
+    retries={'max_attempts': 10, 'mode': 'adaptive'}
 )
 
+
+def _keep_alive(request, **kwargs):
+    """Ask the server to hold the connection open for the next request."""
+    request.headers['Connection'] = 'keep-alive'
+
+
+def make_resource(**kwargs):
+    """DynamoDB resource from the shared session with keep-alive requests."""
+    resource = SESSION.resource('dynamodb', config=CFG, **kwargs)
+    resource.meta.client.meta.events.register('request-created.dynamodb', _keep_alive)
+    return resource
+
+
+def make_raw_client(**kwargs):
+    """Low-level DynamoDB client (wire-format items, no TypeSerializer) with keep-alive."""
+    client = SESSION.client('dynamodb', config=CFG, **kwargs)
+    client.meta.events.register('request-created.dynamodb', _keep_alive)
+    return client
+
+
+AWS_ARGS = {'aws_access_key_id': AWS_KEY, 'aws_secret_access_key': AWS_SECRET}
+SCYLLA_ARGS = {'endpoint_url': SCYLLA_ENDPOINT, 'aws_access_key_id': 'fake', 'aws_secret_access_key': 'fake'}
+
+# Create clients; resources create tables, the thread-safe raw ones do the timed work
+aws_client = make_resource(**AWS_ARGS)
+scylla_client = make_resource(**SCYLLA_ARGS)
+aws_raw = make_raw_client(**AWS_ARGS)
+scylla_raw = make_raw_client(**SCYLLA_ARGS)
+
 def create_table(client, table_name):
     """Create YCSB table."""
     try:
@@ -62,8 +107,9 @@ def create_table(client, table_name):
         return client.Table(table_name)
 
 def generate_value(length):
-    """Generate random string of specified length."""
-    return ''.join(random.choices(string.ascii_letters + string.digits, k=length))
+    """Random string of the given length: a slice of _VALUE_POOL at a random offset."""
+    offset = random.randrange(len(_VALUE_POOL) - length)
+    return _VALUE_POOL[offset:offset + length]
 
 def generate_record(key):
     """Generate YCSB record."""
@@ -72,36 +118,144 @@ def generate_record(key):
         record[f'field{i}'] = generate_value(FIELD_LENGTH)
     return record
 
-def load_data(table, start_key, end_key, results):
-    """Load data into table."""
-    latencies = []
-    for key in range(start_key, end_key):
-        record = generate_record(key)
-        start = time.time()
-        table.put_item(Item=record)
-        latencies.append((time.time() - start) * 1000)
-    results.extend(latencies)
-
-def run_workload(table, operation_count, read_proportion, results):
-    """Run YCSB workload."""
-    latencies = []
+def warmup(table, n=WARMUP_COUNT):
+    """Untimed put/get pairs so DNS, TLS and the connection pool are warm before timing."""
+    for i in range(n):
+        key = {'id': f'warmup{i}'}
+        table.put_item(Item=key)
+        table.get_item(Key=key)
+
+class LatencyHistogram:
+    """
+    HDR-style latency histogram over ns samples.
+    
+    Each sample is rounded down to HIST_PRECISION_BITS significant bits, so
+    memory is bounded by the number of distinct buckets (a few thousand from
+    1 us to a minute), not by the sample count.
+    """
+    
+    __slots__ = ('counts', 'count', 'total_ns')
+    
+    def __init__(self):
+        self.counts = Counter()
+        self.count = 0
+        self.total_ns = 0
+    
+    def record(self, ns, n=1):
+        """Add n samples of ns nanoseconds."""
+        shift = max(ns.bit_length() - HIST_PRECISION_BITS, 0)
+        self.counts[(ns >> shift) << shift] += n
+        self.count += n
+        self.total_ns += ns * n
+    
+    def merge(self, other):
+        """Fold another histogram (e.g. a worker thread's) into this one."""
+        self.counts.update(other.counts)
+        self.count += other.count
+        self.total_ns += other.total_ns
+    
+    def mean_ms(self):
+        """Exact mean of the recorded samples, in ms."""
+        return self.total_ns / self.count / NS_PER_MS
+    
+    def percentiles_ms(self, percentiles):
+        """Nearest-rank values in ms for ascending percentiles, in one bucket walk."""
+        ranks = [min(int(self.count * p / 100), self.count - 1) for p in percentiles]
+        values = []
+        buckets = iter(sorted(self.counts.items()))
+        seen = 0
+        for rank in ranks:
+            while seen <= rank:
+                bucket, n = next(buckets)
+                seen += n
+            values.append(bucket / NS_PER_MS)
+        return values
+
+def to_wire_item(record):
+    """Record in DynamoDB wire format; every YCSB field is a string."""
+    return {name: {'S': value} for name, value in record.items()}
+
+def to_put_request(record):
+    """BatchWriteItem PutRequest in wire format."""
+    return {'PutRequest': {'Item': to_wire_item(record)}}
+
+def load_data(table, records, hist, raw_client):
+    """
+    Load pre-generated records into table; only the writes are timed.
+    
+    Loader threads share raw_client (clients are thread-safe, resources are
+    not). With BATCH_LOAD, records are to_put_request() dicts; otherwise
+    to_wire_item() dicts.
+    """
+    if BATCH_LOAD:
+        # One request per LOAD_BATCH_SIZE items; each item gets the window's mean latency
+        for i in range(0, len(records), LOAD_BATCH_SIZE):
+            window = records[i:i + LOAD_BATCH_SIZE]
+            start = time.perf_counter_ns()
+            request = {table.name: window}
+            attempt = 0
+            while True:
+                # CFG only retries throttling *errors*; a 200 that leaves items
+                # unprocessed is on us, so back off (full jitter) before resending
+                request = raw_client.batch_write_item(RequestItems=request).get('UnprocessedItems')
+                if not request:
+                    break
+                time.sleep(random.uniform(0, min(UNPROCESSED_BACKOFF_CAP, UNPROCESSED_BACKOFF_BASE * 2 ** attempt)))
+                attempt += 1
+            per_item = (time.perf_counter_ns() - start) // len(window)
+            hist.record(per_item, len(window))
+    else:
+        for record in records:
+            start = time.perf_counter_ns()
+            raw_client.put_item(TableName=table.name, Item=record)
+            hist.record(time.perf_counter_ns() - start)
+
+def plan_workload(operation_count, read_proportion):
+    """Pre-generate (op_type, key, record) tuples so RNG work stays out of timing."""
+    ops = []
     for _ in range(operation_count):
         key = random.randint(0, RECORD_COUNT - 1)
         
         if random.random() < read_proportion:
-            # Read operation
-            start = time.time()
-            table.get_item(Key={'id': f'user{key}'})
-            latencies.append((time.time() - start) * 1000)
+            ops.append(('read', {'id': {'S': f'user{key}'}}, None))
         else:
-            # Update operation
-            record = generate_record(key)
-            start = time.time()
-            table.put_item(Item=record)
-            latencies.append((time.time() - start) * 1000)
-    results.extend(latencies)
-
-def run_benchmark(client, platform_name):
+            ops.append(('update', None, to_wire_item(generate_record(key))))
+    return ops
+
+def execute_op(raw_client, table_name, op):
+    """Run one planned (wire-format) operation; returns its latency in ns."""
+    op_type, key, record = op
+    start = time.perf_counter_ns()
+    if op_type == 'read':
+        raw_client.get_item(TableName=table_name, Key=key)
+    else:
+        raw_client.put_item(TableName=table_name, Item=record)
+    return time.perf_counter_ns() - start
+
+def run_workload(raw_client, table_name, ops, hists):
+    """Run YCSB workload, recording each latency in hists[op_type]."""
+    if SINGLE_THREAD:
+        for op in ops:
+            hists[op[0]].record(execute_op(raw_client, table_name, op))
+    else:
+        # Workers share the thread-safe client, never a Table resource
+        with ThreadPoolExecutor(max_workers=RUN_WORKERS) as executor:
+            latencies = executor.map(lambda op: execute_op(raw_client, table_name, op), ops)
+            for op, latency in zip(ops, latencies):
+                hists[op[0]].record(latency)
+
+def percentile_key(p):
+    """Results key for a percentile: 99 -> 'p99_latency', 99.9 -> 'p999_latency'."""
+    return f"p{p:g}".replace('.', '') + '_latency'
+
+def latency_stats(hist, prefix=''):
+    """Mean, P50 and TAIL_PERCENTILES of a histogram in ms; keys like 'read_p99_latency'."""
+    percentiles = (50, *TAIL_PERCENTILES)
+    stats = {f'{prefix}avg_latency': hist.mean_ms()}
+    stats.update(zip((prefix + percentile_key(p) for p in percentiles), hist.percentiles_ms(percentiles)))
+    return stats
+
+def run_benchmark(client, platform_name, raw_client):
     """Run complete benchmark for a platform."""
     print(f"\n📊 {platform_name} Benchmark")
     print("-" * 40)
@@ -121,66 +275,86 @@ def run_benchmark(client, platform_name):
     else:
         time.sleep(5)
     
+    # Warmup; latencies are discarded
+    print(f"Warming up with {WARMUP_COUNT} put/get pairs...")
+    warmup(table)
+    
     # Load phase
     print(f"\n🔄 Load Phase: Inserting {RECORD_COUNT} records...")
-    load_latencies = []
-    load_start = time.time()
+    records = [generate_record(key) for key in range(RECORD_COUNT)]
+    records = [(to_put_request if BATCH_LOAD else to_wire_item)(record) for record in records]
+    # One histogram per loader thread, merged afterwards; no shared counters
+    load_latencies = LatencyHistogram()
+    load_start = time.perf_counter()
     
     # Use multiple threads for loading
-    with ThreadPoolExecutor(max_workers=10) as executor:
-        chunk_size = RECORD_COUNT // 10
+    with ThreadPoolExecutor(max_workers=LOAD_WORKERS) as executor:
+        chunk_size = RECORD_COUNT // LOAD_WORKERS
         futures = []
-        for i in range(10):
+        for i in range(LOAD_WORKERS):
             start = i * chunk_size
-            end = start + chunk_size if i < 9 else RECORD_COUNT
-            thread_results = []
-            future = executor.submit(load_data, table, start, end, thread_results)
+            end = start + chunk_size if i < LOAD_WORKERS - 1 else RECORD_COUNT
+            thread_results = LatencyHistogram()
+            future = executor.submit(load_data, table, records[start:end], thread_results, raw_client)
             futures.append((future, thread_results))
         
         for future, thread_results in futures:
             future.result()
-            load_latencies.extend(thread_results)
+            load_latencies.merge(thread_results)
     
-    load_time = time.time() - load_start
+    load_time = time.perf_counter() - load_start
     
     # Run phase
     print(f"\n⚡ Run Phase: Executing {OPERATION_COUNT} operations...")
-    run_latencies = []
-    run_start = time.time()
+    ops = plan_workload(OPERATION_COUNT, READ_PROPORTION)
+    op_latencies = {op_type: LatencyHistogram() for op_type in OP_TYPES}
+    run_start = time.perf_counter()
     
-    # Single thread for run phase (YCSB default)
-    run_workload(table, OPERATION_COUNT, READ_PROPORTION, run_latencies)
+    # RUN_WORKERS concurrent clients; --single-thread for the YCSB default
+    run_workload(raw_client, table_name, ops, op_latencies)
     
-    run_time = time.time() - run_start
+    run_time = time.perf_counter() - run_start
     
-    # Calculate statistics
-    all_latencies = load_latencies + run_latencies
+    # Calculate statistics. Batched load latencies are per-batch time / batch
+    # size, so they never share a histogram with the per-op run latencies
+    run_latencies = LatencyHistogram()
+    for hist in op_latencies.values():
+        run_latencies.merge(hist)
     
     results = {
         'load_time': load_time,
         'load_throughput': RECORD_COUNT / load_time,
         'run_time': run_time,
         'run_throughput': OPERATION_COUNT / run_time,
-        'avg_latency': statistics.mean(all_latencies),
-        'p50_latency': statistics.median(all_latencies),
-        'p95_latency': sorted(all_latencies)[int(len(all_latencies) * 0.95)],
-        'p99_latency': sorted(all_latencies)[int(len(all_latencies) * 0.99)],
+        **latency_stats(load_latencies, 'load_'),
+        **latency_stats(run_latencies, 'run_'),
     }
     
+    # Load, read and update are different workloads; keep their stats apart
+    for op_type, hist in op_latencies.items():
+        if hist.count:
+            results[f'{op_type}_throughput'] = hist.count / run_time
+            results.update(latency_stats(hist, f'{op_type}_'))
+    
     # Print results
     print(f"\n📈 Results:")
-    print(f"  Load throughput: {results['load_throughput']:.0f} ops/sec")
-    print(f"  Run throughput: {results['run_throughput']:.0f} ops/sec")
-    print(f"  Average latency: {results['avg_latency']:.1f} ms")
-    print(f"  P50 latency: {results['p50_latency']:.1f} ms")
-    print(f"  P95 latency: {results['p95_latency']:.1f} ms")
-    print(f"  P99 latency: {results['p99_latency']:.1f} ms")
+    if BATCH_LOAD:
+        print(f"  LOAD latency is per item (batch time / items in batch, up to {LOAD_BATCH_SIZE})")
+    print("  RUN covers reads and updates together")
+    for phase in ('load', 'run', *OP_TYPES):
+        if f'{phase}_avg_latency' not in results:
+            continue
+        print(f"  [{phase.upper()}] {results[f'{phase}_throughput']:.0f} ops/sec, "
+              f"avg {results[f'{phase}_avg_latency']:.1f} ms, "
+              f"P50 {results[f'{phase}_p50_latency']:.1f} ms, "
+              f"P95 {results[f'{phase}_p95_latency']:.1f} ms, "
+              f"P99 {results[f'{phase}_p99_latency']:.1f} ms")
     
     return results
 
 # Run benchmarks
-aws_results = run_benchmark(aws_client, "AWS DynamoDB")
-scylla_results = run_benchmark(scylla_client, "ScyllaDB Alternator")
+aws_results = run_benchmark(aws_client, "AWS DynamoDB", aws_raw)
+scylla_results = run_benchmark(scylla_client, "ScyllaDB Alternator", scylla_raw)
 
 # Compare results
 print("\n" + "=" * 50)
@@ -189,13 +363,20 @@ print("=" * 50)
 
 metrics = [
     ('Load Throughput', 'load_throughput', 'ops/sec'),
-    ('Run Throughput', 'run_throughput', 'ops/sec'),
-    ('Avg Latency', 'avg_latency', 'ms'),
-    ('P95 Latency', 'p95_latency', 'ms'),
-    ('P99 Latency', 'p99_latency', 'ms'),
+    ('Load P99 Latency (per item)' if BATCH_LOAD else 'Load P99 Latency', 'load_p99_latency', 'ms'),
+    ('Read Throughput', 'read_throughput', 'ops/sec'),
+    ('Read Avg Latency', 'read_avg_latency', 'ms'),
+    ('Read P99 Latency', 'read_p99_latency', 'ms'),
+    ('Update Throughput', 'update_throughput', 'ops/sec'),
+    ('Update Avg Latency', 'update_avg_latency', 'ms'),
+    ('Update P99 Latency', 'update_p99_latency', 'ms'),
+    ('Run Throughput (reads + updates)', 'run_throughput', 'ops/sec'),
+    ('Run P99 Latency (reads + updates)', 'run_p99_latency', 'ms'),
 ]
 
 for name, metric, unit in metrics:
+    if metric not in aws_results or metric not in scylla_results:
+        continue  # No operations of this type in the run
     aws_val = aws_results[metric]
     scylla_val = scylla_results[metric]
     
@@ -13,16 +13,30 @@ This represents a typical e-commerce application with:
 """
 
 import boto3
+from boto3.dynamodb.types import TypeDeserializer, TypeSerializer
+from botocore.config import Config
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from decimal import Decimal
+from functools import lru_cache
 import json
 
-# Initialize DynamoDB client
-dynamodb = boto3.resource('dynamodb', region_name='us-east-1')
+# Initialize DynamoDB client; one session and connection pool for every helper
+SESSION = boto3.session.Session(region_name='us-east-1')
+dynamodb = SESSION.resource('dynamodb', config=Config(max_pool_connections=16))
+# Resources aren't thread-safe; helpers that fan out across threads share this client
+client = dynamodb.meta.client
+_deserialize = TypeDeserializer().deserialize  # wire format -> Python, as Table returns
 
 # Table design following single-table pattern
 TABLE_NAME = 'OnlineShop'
 
+
+@lru_cache(maxsize=None)
+def _table():
+    """Shared Table resource, built on first use"""
+    return dynamodb.Table(TABLE_NAME)
+
 def create_table():
     """Create the single table with GSIs for access patterns"""
     table = dynamodb.create_table(
@@ -65,7 +79,7 @@ def create_table():
 
 def add_user(user_id, email, name):
     """Add a user to the system"""
-    table = dynamodb.Table(TABLE_NAME)
+    table = _table()
     table.put_item(
         Item={
             'PK': f'USER#{user_id}',
@@ -82,7 +96,7 @@ def add_user(user_id, email, name):
 
 def add_product(product_id, name, price, category, inventory):
     """Add a product to the catalog"""
-    table = dynamodb.Table(TABLE_NAME)
+    table = _table()
     table.put_item(
         Item={
             'PK': f'PRODUCT#{product_id}',
@@ -101,10 +115,16 @@ def add_product(product_id, name, price, category, inventory):
 
 def create_order(user_id, order_id, items):
     """Create an order with multiple items (transaction)"""
-    table = dynamodb.Table(TABLE_NAME)
+    table = _table()
+    
+    # Parse each price to Decimal once; reused for the total and the item rows
+    items = [{**item, 'price': Decimal(str(item['price']))} for item in items]
     
     # Calculate total
-    total = sum(Decimal(str(item['price'])) * item['quantity'] for item in items)
+    total = sum((item['price'] * item['quantity'] for item in items), Decimal(0))
+    
+    # Order creation time, stamped on the header
+    now = datetime.utcnow().isoformat()
     
     # Use transaction to ensure consistency
     with table.batch_writer() as batch:
@@ -120,7 +140,7 @@ def create_order(user_id, order_id, items):
                 'UserID': user_id,
                 'Status': 'PENDING',
                 'Total': total,
-                'CreatedAt': datetime.utcnow().isoformat()
+                'CreatedAt': now
             }
         )
         
@@ -133,14 +153,14 @@ def create_order(user_id, order_id, items):
                     'Type': 'OrderItem',
                     'ProductID': item['product_id'],
                     'ProductName': item['name'],
-                    'Price': Decimal(str(item['price'])),
+                    'Price': item['price'],
                     'Quantity': item['quantity']
                 }
             )
 
 def add_to_cart(user_id, product_id, quantity):
     """Add item to shopping cart"""
-    table = dynamodb.Table(TABLE_NAME)
+    table = _table()
     table.put_item(
         Item={
             'PK': f'USER#{user_id}',
@@ -154,7 +174,7 @@ def add_to_cart(user_id, product_id, quantity):
 
 def get_user_orders(user_id):
     """Get all orders for a user"""
-    table = dynamodb.Table(TABLE_NAME)
+    table = _table()
     response = table.query(
         KeyConditionExpression='PK = :pk AND begins_with(SK, :sk)',
         ExpressionAttributeValues={
@@ -166,7 +186,7 @@ def get_user_orders(user_id):
 
 def get_products_by_category(category):
     """Get all products in a category using GSI"""
-    table = dynamodb.Table(TABLE_NAME)
+    table = _table()
     response = table.query(
         IndexName='GSI1',
         KeyConditionExpression='GSI1PK = :pk',
@@ -178,7 +198,7 @@ def get_products_by_category(category):
 
 def update_inventory(product_id, quantity_change):
     """Update product inventory (atomic counter)"""
-    table = dynamodb.Table(TABLE_NAME)
+    table = _table()
     response = table.update_item(
         Key={
             'PK': f'PRODUCT#{product_id}',
@@ -194,36 +214,42 @@ def update_inventory(product_id, quantity_change):
 
 def get_hot_products():
     """Simulate hot partition - everyone queries for featured products"""
-    table = dynamodb.Table(TABLE_NAME)
+    # Called from many threads at once, so it queries through the shared client
     # This creates a hot partition on CATEGORY#featured
-    response = table.query(
+    response = client.query(
+        TableName=TABLE_NAME,
         IndexName='GSI1',
         KeyConditionExpression='GSI1PK = :pk',
         ExpressionAttributeValues={
-            ':pk': 'CATEGORY#featured'
+            ':pk': {'S': 'CATEGORY#featured'}
         }
     )
-    return response['Items']
+    return [{k: _deserialize(v) for k, v in item.items()} for item in response['Items']]
 
 def bulk_update_prices(category, percentage_change):
-    """Bulk update prices for a category - inefficient pattern"""
-    table = dynamodb.Table(TABLE_NAME)
+    """Bulk update prices for a category - still one UpdateItem per product"""
+    # Serialized once; worker threads send wire-format requests through client
+    factor = TypeSerializer().serialize(Decimal(1 + percentage_change/100))
     
     # First, get all products in category
     products = get_products_by_category(category)
     
-    # Then update each one individually (anti-pattern)
-    for product in products:
-        table.update_item(
+    def update_price(product):
+        client.update_item(
+            TableName=TABLE_NAME,
             Key={
-                'PK': product['PK'],
-                'SK': product['SK']
+                'PK': {'S': product['PK']},
+                'SK': {'S': product['SK']}
             },
             UpdateExpression='SET Price = Price * :factor',
             ExpressionAttributeValues={
-                ':factor': Decimal(1 + percentage_change/100)
+                ':factor': factor
             }
         )
+    
+    # Updates are independent (no atomicity across products), so overlap them
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(update_price, products))
 
 # Example usage patterns
 if __name__ == "__main__":
@@ -256,8 +282,9 @@ if __name__ == "__main__":
     
     # Anti-patterns
     print("\nHot partition access (featured products)...")
-    for _ in range(100):  # Simulate many requests
-        get_hot_products()
+    # Simulate many concurrent requests, so the partition (not the client) is the bottleneck
+    with ThreadPoolExecutor(max_workers=32) as executor:
+        list(executor.map(lambda _: get_hot_products(), range(100)))
     
-    print("\nBulk price update (inefficient)...")
+    print("\nBulk price update (one request per product)...")
     bulk_update_prices("electronics", 10)  # 10% increase
\ No newline at end of file
@@ -3,8 +3,9 @@
 
 import os
 import json
-from cassandra.cluster import Cluster
+from cassandra.cluster import Cluster, ExecutionProfile, EXEC_PROFILE_DEFAULT
 from cassandra.auth import PlainTextAuthProvider
+from cassandra.policies import DCAwareRoundRobinPolicy
 
 # Load config from .claude directory
 config_path = '.claude/config.json'
@@ -31,16 +32,31 @@ print()
 try:
     # Create connection
     auth_provider = PlainTextAuthProvider(username=username, password=password)
+    
+    # Route to the configured datacenter; request timeout lives on the profile
+    profile = ExecutionProfile(
+        load_balancing_policy=DCAwareRoundRobinPolicy(local_dc=datacenter),
+        request_timeout=10
+    )
     cluster = Cluster(
         [host],
         auth_provider=auth_provider,
-        port=9042
+        port=9042,
+        protocol_version=4,
+        compression=True,  # Prefers lz4, then snappy, when installed
+        connect_timeout=10,
+        idle_heartbeat_interval=30,
+        execution_profiles={EXEC_PROFILE_DEFAULT: profile}
     )
     
     session = cluster.connect()
     
+    # Prepared once; re-runs bind by statement id instead of re-parsing CQL
+    select_local = session.prepare("SELECT cluster_name, release_version FROM system.local")
+    select_keyspaces = session.prepare("SELECT keyspace_name FROM system_schema.keyspaces")
+    
     # Test query
-    result = session.execute("SELECT cluster_name, release_version FROM system.local")
+    result = session.execute(select_local)
     for row in result:
         print(f"✅ Connected to ScyllaDB Cloud!")
         print(f"   Cluster: {row.cluster_name}")
@@ -48,7 +64,7 @@ try:
     
     # List keyspaces
     print(f"\n📊 Available keyspaces:")
-    result = session.execute("SELECT keyspace_name FROM system_schema.keyspaces")
+    result = session.execute(select_keyspaces)
     for row in result:
         print(f"   - {row.keyspace_name}")
     